@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Demonstrate the DST exception classes (formerly the exceptions.py self-test)
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from exceptions import DSTError, PathNotFoundError, create_exception_from_error
+
+
+def main():
+    # Test the exception classes
+
+    # Test basic exception
+    try:
+        raise PathNotFoundError("/nonexistent/path", "file conversion")
+    except DSTError as e:
+        print("Exception details:")
+        print(f"  Type: {type(e).__name__}")
+        print(f"  Message: {e}")
+        print(f"  Remediation: {e.remediation}")
+        print(f"  Context: {e.context}")
+        print(f"  Dict representation: {e.to_dict()}")
+
+    print("\n" + "="*50 + "\n")
+
+    # Test exception conversion
+    try:
+        raise FileNotFoundError("Test file not found")
+    except Exception as e:
+        dst_error = create_exception_from_error(e, {'path': '/test/file.txt', 'operation': 'read'})
+        print("Converted exception:")
+        print(f"  Type: {type(dst_error).__name__}")
+        print(f"  Message: {dst_error}")
+        print(f"  Remediation: {dst_error.remediation}")
+        print(f"  Context: {dst_error.context}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,10 @@ Create the final PDF from JSON structure with dynamic title page generation
 
 import os
 import json
+import logging
 import tempfile
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from pypdf import PdfReader, PdfWriter
 try:
     from .title_page_generator import TitlePageGenerator
@@ -19,6 +20,9 @@ except ImportError:
     from config import get_config
     from logger import get_logger, log_processing_stage, log_json_snapshot, log_file_conversion
 
+# Output buffer for the final PDF save
+_WRITE_BUFFER_SIZE = 1 << 20
+
 class FinalPDFAssembler:
     def __init__(self, docs_path: str, converted_pdfs_dir: str = None, 
                  title_pages_dir: str = None):
@@ -123,7 +127,6 @@ class FinalPDFAssembler:
                 return False, None, None, None
             
             reader = PdfReader(pdf_path)
-            page_count = len(reader.pages)
             
             # Record the starting page number (0-indexed)
             start_page = len(writer.pages)
@@ -142,13 +145,29 @@ class FinalPDFAssembler:
                     parent=bookmark_parent
                 )
             
-            self.logger.info(f"Added {os.path.basename(pdf_path)} ({page_count} pages)")
+            # Page count comes from the writer so the reader's pages tree is not walked again
+            if self.logger.isEnabledFor(logging.INFO):
+                page_count = end_page - start_page + 1
+                self.logger.info(f"Added {os.path.basename(pdf_path)} ({page_count} pages)")
             return True, start_page, end_page, bookmark_ref
             
         except Exception as e:
             self.logger.error(f"Failed to add {pdf_path}: {e}")
             return False, None, None, None
 
+    def _build_outline(self, writer: PdfWriter,
+                       outline_entries: List[Tuple[str, int, Optional[int]]]) -> int:
+        """Build the bookmark tree in one pass from (title, start_page, parent_index) entries"""
+        refs = []
+        for title, start_page, parent_index in outline_entries:
+            parent_ref = refs[parent_index] if parent_index is not None else None
+            refs.append(writer.add_outline_item(
+                title=title,
+                page_number=start_page,
+                parent=parent_ref
+            ))
+        return len(refs)
+
     def resolve_converted_path(self, item: Dict) -> Optional[str]:
         """Resolve the actual converted PDF path for an item"""
         if item['type'] == 'cut_sheet':
@@ -217,8 +236,10 @@ class FinalPDFAssembler:
             'excluded_items': len(self.pdf_structure) - len(included_items)
         })
         
-        # Track current parent bookmark for hierarchical organization
-        current_parent_bookmark = None
+        # Bookmarks are collected as (title, start_page, parent_index) and the
+        # outline tree is built once after all pages have been appended
+        outline_entries: List[Tuple[str, int, Optional[int]]] = []
+        current_parent_index = None
         title_pages_added = 0
         documents_added = 0
         cut_sheets_added = 0
@@ -239,13 +260,13 @@ class FinalPDFAssembler:
                 title_page_path = self.generate_title_page(tag, title)
                 
                 if title_page_path and os.path.exists(title_page_path):
-                    success, start_page, end_page, bookmark_ref = self.add_pdf_to_writer(
-                        writer, title_page_path, f"Title page for {title}",
-                        add_bookmark=True, bookmark_title=title
+                    success, start_page, end_page, _ = self.add_pdf_to_writer(
+                        writer, title_page_path, f"Title page for {title}"
                     )
                     
                     if success:
-                        current_parent_bookmark = bookmark_ref
+                        current_parent_index = len(outline_entries)
+                        outline_entries.append((title, start_page, None))
                         title_pages_added += 1
                         log_processing_stage('title_page_added', 'success', {
                             'tag': tag,
@@ -270,13 +291,12 @@ class FinalPDFAssembler:
                 if converted_path:
                     display_title = item.get('display_title', item.get('filename', 'Unknown'))
                     
-                    success, start_page, end_page, bookmark_ref = self.add_pdf_to_writer(
-                        writer, converted_path, f"{item_type}: {display_title}",
-                        add_bookmark=True, bookmark_title=display_title,
-                        bookmark_parent=current_parent_bookmark
+                    success, start_page, end_page, _ = self.add_pdf_to_writer(
+                        writer, converted_path, f"{item_type}: {display_title}"
                     )
                     
                     if success:
+                        outline_entries.append((display_title, start_page, current_parent_index))
                         if item_type == 'document':
                             documents_added += 1
                         else:
@@ -311,9 +331,17 @@ class FinalPDFAssembler:
                     'item': item
                 })
         
+        # Build the bookmark tree in a single pass
+        bookmarks_added = self._build_outline(writer, outline_entries)
+        self.logger.info(f"Added {bookmarks_added} bookmarks")
+        
         # Write final PDF
         self.logger.info(f"\nWriting final PDF: {output_filename}")
-        with open(output_filename, 'wb') as output_file:
+        # pypdf copies existing content streams as-is (no re-compression) and
+        # never linearizes; linearization only matters for web-streamed viewing,
+        # which internal submittals don't need. The serializer issues many small
+        # writes, so a large buffer keeps the save from being syscall-bound.
+        with open(output_filename, 'wb', buffering=_WRITE_BUFFER_SIZE) as output_file:
             writer.write(output_file)
         
         self.logger.info(f"Successfully created: {output_filename}")
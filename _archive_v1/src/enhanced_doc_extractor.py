@@ -7,70 +7,154 @@ Creates a comprehensive structure including title pages, documents, and cut shee
 import os
 import re
 import json
-import glob
-from typing import Optional, Dict, List
+import hashlib
+import mmap
+import zipfile
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Optional, Dict, List, Tuple
 from pathlib import Path
 
+# Multi-pattern filename classification
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # Import diagnostic logging functions
 try:
-    from .logger import log_processing_stage, log_json_snapshot
+    from .logger import get_logger, log_processing_stage, log_json_snapshot
 except ImportError:
-    from logger import log_processing_stage, log_json_snapshot
+    from logger import get_logger, log_processing_stage, log_json_snapshot
+
+logger = get_logger('doc_extractor')
+
+# On-disk cache of generated structures (most recent entries kept). Off unless
+# DST_STRUCTURE_CACHE=1, since a hit skips the pricing scan; entries live in a
+# per-user cache directory
+STRUCTURE_CACHE_ENABLED = os.environ.get('DST_STRUCTURE_CACHE', '0') == '1'
+_STRUCTURE_CACHE_DIR = os.environ.get(
+    'DST_STRUCTURE_CACHE_DIR',
+    os.path.join(os.environ.get('LOCALAPPDATA') or os.environ.get('XDG_CACHE_HOME')
+                 or os.path.join(os.path.expanduser('~'), '.cache'),
+                 'dst_submittals', 'structure_cache')
+)
+_STRUCTURE_CACHE_SIZE = 16
+# Bump when the structure format or the way it is generated changes, so
+# entries written by older code are never reused
+_STRUCTURE_CACHE_VERSION = 1
+
+# Parts of a .docx archive that carry visible text
+_DOCX_TEXT_PARTS = ('word/document.xml', 'word/header1.xml', 'word/footer1.xml')
+
+# Filename normalization patterns
+_NUM_PREFIX_RE = re.compile(r'^\d+_')
+_NUM_PREFIX_SPACE_RE = re.compile(r'^\d+\s')
+_MULTISPACE_RE = re.compile(r'\s+')
+
+# Document types that never carry pricing, so their content is not scanned
+_NO_PRICING_FILE_TYPES = frozenset({'Technical Data Sheet', 'Fan Curve', 'Drawing'})
+
+# Filename substrings checked in priority order by classify_file_type
+_CLASSIFIERS = (
+    ('technical data sheet', 'Technical Data Sheet'),
+    ('tech data', 'Technical Data Sheet'),
+    ('fan curve', 'Fan Curve'),
+    ('drawing', 'Drawing'),
+    ('cut sheet', 'Cut Sheet'),
+    ('item summary', 'Item Summary'),
+)
+_CS_PRIORITY = 4
+
+# Aho-Corasick automaton over the classifier patterns (optional dependency)
+_CLASSIFIER_AUTOMATON = None
+if AHOCORASICK_AVAILABLE:
+    _CLASSIFIER_AUTOMATON = ahocorasick.Automaton()
+    for _rank, (_pattern, _) in enumerate(_CLASSIFIERS):
+        _CLASSIFIER_AUTOMATON.add_word(_pattern, _rank)
+    _CLASSIFIER_AUTOMATON.make_automaton()
+
+# Priority order for file types within a tag
+_PRIORITY_ORDER = MappingProxyType({
+    'Technical Data Sheet': 1,
+    'Fan Curve': 2,
+    'Drawing': 3,
+    'Other': 4,
+    'Item Summary': 5  # Should be filtered out anyway
+})
+
+# Filename keywords that suggest pricing (e.g., "Item Summary", "Pricing", "Cost")
+_PRICING_KW_RE = re.compile(r'item summary|pricing|cost|price|quote', re.I)
 
 def has_pricing_content(file_path: str) -> bool:
     """Check if a file contains pricing information ($ symbols)"""
     if not os.path.exists(file_path):
         return False
-        
+    
+    # The filename already decides the common document types without any I/O
+    file_type = classify_file_type(os.path.basename(file_path))
+    if file_type == 'Item Summary':
+        return True
+    if file_type in _NO_PRICING_FILE_TYPES:
+        return False
+    
+    # Cache by (path, mtime) so an edited file is rescanned
+    return _has_pricing_content_cached(file_path, os.path.getmtime(file_path))
+
+@lru_cache(maxsize=4096)
+def _has_pricing_content_cached(file_path: str, mtime: float) -> bool:
+    """Scan a file for pricing content (memoized by has_pricing_content)"""
     filename = os.path.basename(file_path)
     file_ext = os.path.splitext(filename)[1].lower()
     
     # For image files, we can't easily check content, so check filename
     if file_ext in ['.jpg', '.jpeg', '.png', '.gif', '.bmp']:
-        # Check if filename suggests pricing (e.g., "Item Summary", "Pricing", "Cost")
-        pricing_keywords = ['item summary', 'pricing', 'cost', 'price', 'quote']
-        filename_lower = filename.lower()
-        return any(keyword in filename_lower for keyword in pricing_keywords)
+        # Check if filename suggests pricing
+        return bool(_PRICING_KW_RE.search(filename))
     
     # For document files, try to read content
     try:
         if file_ext == '.docx':
-            from docx import Document
-            doc = Document(file_path)
-            # Check paragraphs
-            for para in doc.paragraphs:
-                if '$' in para.text:
-                    return True
-            # Check tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        if '$' in cell.text:
-                            return True
+            # Scan the raw OOXML parts for $ instead of building a python-docx object tree
+            # (paragraphs and table cells all live in these parts)
+            # Parts are inflated in 64 KiB chunks so decompression stops at the first $
+            with zipfile.ZipFile(file_path) as z:
+                part_names = set(z.namelist())
+                for name in _DOCX_TEXT_PARTS:
+                    if name not in part_names:
+                        continue
+                    with z.open(name) as fp:
+                        while True:
+                            buf = fp.read(65536)
+                            if not buf:
+                                break
+                            if b'$' in buf:
+                                return True
                             
         elif file_ext == '.doc':
-            # For .doc files, do a simple binary search for $ symbols
+            # For .doc files, memory-map the file and let the OS page in only what
+            # the scan touches ('$' is a single ASCII byte, so no decode is needed)
+            if os.path.getsize(file_path) == 0:
+                return False
             with open(file_path, 'rb') as f:
-                content = f.read()
-            text_content = content.decode('utf-8', errors='ignore')
-            if '$' in text_content:
-                return True
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return mm.find(b'$') != -1
                 
         elif file_ext == '.pdf':
             # For PDF files, we'll assume they don't have pricing unless filename suggests it
-            pricing_keywords = ['item summary', 'pricing', 'cost', 'price', 'quote']
-            filename_lower = filename.lower()
-            return any(keyword in filename_lower for keyword in pricing_keywords)
+            return bool(_PRICING_KW_RE.search(filename))
             
     except Exception as e:
-        print(f"  [WARNING] Could not check pricing content in {filename}: {e}")
+        logger.warning(f"Could not check pricing content in {filename}: {e}")
         # If we can't read the file, check filename for pricing keywords
-        pricing_keywords = ['item summary', 'pricing', 'cost', 'price', 'quote']
-        filename_lower = filename.lower()
-        return any(keyword in filename_lower for keyword in pricing_keywords)
+        return bool(_PRICING_KW_RE.search(filename))
     
     return False
 
+@lru_cache(maxsize=4096)
 def classify_file_type(filename: str) -> str:
     """Classify file type based on filename patterns"""
     filename_lower = filename.lower()
@@ -80,29 +164,39 @@ def classify_file_type(filename: str) -> str:
     normalized_name = filename_lower.replace('_', ' ').replace('-', ' ')
     
     # Remove numeric prefix for classification
-    clean_name = re.sub(r'^\d+\s', '', normalized_name)
-
-    # Perform checks on the clean, normalized name
-    if 'technical data sheet' in clean_name or 'tech data' in clean_name:
-        return 'Technical Data Sheet'
-    elif 'fan curve' in clean_name:
-        return 'Fan Curve'
-    elif 'drawing' in clean_name:
-        return 'Drawing'
-    elif 'cut sheet' in clean_name or filename.upper().startswith('CS'):
-        return 'Cut Sheet'
-    elif 'item summary' in clean_name:
-        return 'Item Summary'
+    clean_name = _NUM_PREFIX_SPACE_RE.sub('', normalized_name)
+
+    return _classify_clean_name(clean_name, filename)
+
+def _classify_clean_name(clean_name: str, filename: str) -> str:
+    """Classify an already lower-cased, separator-normalized filename"""
+    # A "CS" filename prefix counts as a cut sheet match, at cut sheet priority
+    best = _CS_PRIORITY if filename.upper().startswith('CS') else len(_CLASSIFIERS)
+    
+    if _CLASSIFIER_AUTOMATON is not None:
+        # One linear pass finds every pattern; keep the highest-priority hit
+        for _, rank in _CLASSIFIER_AUTOMATON.iter(clean_name):
+            if rank < best:
+                best = rank
     else:
-        return 'Other'
+        for rank in range(best):
+            if _CLASSIFIERS[rank][0] in clean_name:
+                best = rank
+                break
+    
+    return _CLASSIFIERS[best][1] if best < len(_CLASSIFIERS) else 'Other'
 
+@lru_cache(maxsize=4096)
 def create_display_title(filename: str) -> str:
     """Create a clean display title from filename"""
     # Remove file extension
-    clean_name = os.path.splitext(filename)[0]
-    
+    return _display_title_from_stem(os.path.splitext(filename)[0])
+
+@lru_cache(maxsize=4096)
+def _display_title_from_stem(stem: str) -> str:
+    """Create a clean display title from a filename without its extension"""
     # Remove numeric prefix (e.g., "10_" from "10_Technical Data Sheet")
-    clean_name = re.sub(r'^\d+_', '', clean_name)
+    clean_name = _NUM_PREFIX_RE.sub('', stem)
     
     # Replace underscores and hyphens with spaces to be consistent with classify_file_type
     clean_name = clean_name.replace('_', ' ').replace('-', ' ')
@@ -112,20 +206,30 @@ def create_display_title(filename: str) -> str:
         clean_name = clean_name[3:]
     
     # Consolidate multiple spaces into one and strip leading/trailing space
-    clean_name = re.sub(r'\s+', ' ', clean_name).strip()
+    clean_name = _MULTISPACE_RE.sub(' ', clean_name).strip()
     
     return clean_name
 
+@lru_cache(maxsize=4096)
+def analyze_filename(filename: str) -> Tuple[str, str, int]:
+    """
+    Classify a filename and build its display title and priority in one pass.
+    
+    Equivalent to calling classify_file_type, create_display_title and
+    get_file_order_priority, but splits and normalizes the name only once.
+    
+    Returns:
+        Tuple of (file_type, display_title, priority)
+    """
+    stem = os.path.splitext(filename)[0]
+    normalized_name = stem.lower().replace('_', ' ').replace('-', ' ')
+    file_type = _classify_clean_name(_NUM_PREFIX_SPACE_RE.sub('', normalized_name), filename)
+    return file_type, _display_title_from_stem(stem), _PRIORITY_ORDER.get(file_type, 4)
+
+@lru_cache(maxsize=4096)
 def get_file_order_priority(file_type: str) -> int:
     """Get priority order for file types within a tag"""
-    priority_order = {
-        'Technical Data Sheet': 1,
-        'Fan Curve': 2,
-        'Drawing': 3,
-        'Other': 4,
-        'Item Summary': 5  # Should be filtered out anyway
-    }
-    return priority_order.get(file_type, 4)
+    return _PRIORITY_ORDER.get(file_type, 4)
 
 def merge_user_customizations(fresh_data: Dict, existing_data: Dict) -> Dict:
     """
@@ -151,7 +255,7 @@ def merge_user_customizations(fresh_data: Dict, existing_data: Dict) -> Dict:
     # Build lookup by item identifier (type + tag + filename combination)
     for item in existing_structure:
         # Create unique identifier for each item
-        identifier = f"{item.get('type', '')}|{item.get('tag', '')}|{item.get('filename', '')}"
+        identifier = (item.get('type', ''), item.get('tag', ''), item.get('filename', ''))
         existing_lookup[identifier] = item
     
     # Apply customizations to fresh structure
@@ -160,7 +264,7 @@ def merge_user_customizations(fresh_data: Dict, existing_data: Dict) -> Dict:
     
     for fresh_item in fresh_structure:
         # Find matching item in existing structure
-        identifier = f"{fresh_item.get('type', '')}|{fresh_item.get('tag', '')}|{fresh_item.get('filename', '')}"
+        identifier = (fresh_item.get('type', ''), fresh_item.get('tag', ''), fresh_item.get('filename', ''))
         existing_item = existing_lookup.get(identifier)
         
         if existing_item:
@@ -191,6 +295,23 @@ def merge_user_customizations(fresh_data: Dict, existing_data: Dict) -> Dict:
     
     return fresh_data
 
+def _tag_sort_key(tag: str) -> tuple:
+    """Custom sort key to handle equipment tags properly"""
+    # MAU tags first (False comes before True)
+    is_ahu = tag.startswith('AHU-')
+    
+    # Extract the numeric/alphanumeric suffix
+    suffix = tag.replace('AHU-', '').replace('MAU-', '')
+    
+    # Handle numeric suffixes (including 0) vs alphanumeric
+    try:
+        # Try to convert to integer for proper numeric sorting
+        numeric_part = int(suffix.split('-')[0])  # Handle cases like "M3 3-20-2025"
+        return (is_ahu, numeric_part, suffix)
+    except ValueError:
+        # Non-numeric suffix, use string sorting with padding
+        return (is_ahu, float('inf'), suffix.zfill(10))
+
 def should_check_pricing_content(filename: str, use_filename_tags: bool) -> bool:
     """
     Determine if a file needs pricing content scanning for performance optimization.
@@ -221,7 +342,7 @@ def should_check_pricing_content(filename: str, use_filename_tags: bool) -> bool
     filename_lower = filename.lower()
     return 'item summary' in filename_lower or 'item_summary' in filename_lower
 
-def enhance_tag_mapping(tag_mapping: Dict[str, str], docs_path: str, no_pricing_filter: bool = False, use_filename_tags: bool = False, existing_user_edits: Dict = None) -> Dict:
+def enhance_tag_mapping(tag_mapping: Dict[str, str], docs_path: str, no_pricing_filter: bool = False, use_filename_tags: bool = False, existing_user_edits: Dict = None, verbose: bool = False) -> Dict:
     """
     Create complete PDF structure from tag mapping with optimized pricing filter.
     
@@ -231,11 +352,15 @@ def enhance_tag_mapping(tag_mapping: Dict[str, str], docs_path: str, no_pricing_
         no_pricing_filter: If True, include all files regardless of pricing content
         use_filename_tags: If True, only scan Item Summary files for pricing (optimization)
         existing_user_edits: Optional existing structure with user customizations to preserve
+        verbose: If True, log per-file details at INFO instead of DEBUG
         
     Returns:
         Enhanced mapping with complete PDF structure
     """
     
+    # Per-file details go through logging; stdout only gets one summary line per tag
+    log_detail = logger.info if verbose else logger.debug
+    
     # Log the start of structure generation
     log_processing_stage('enhance_tag_mapping', 'started', {
         'docs_path': docs_path,
@@ -244,6 +369,14 @@ def enhance_tag_mapping(tag_mapping: Dict[str, str], docs_path: str, no_pricing_
         'tag_mapping_size': len(tag_mapping)
     })
     
+    # Repeated renders of an unchanged directory reuse the structure from disk
+    cache_key = _structure_cache_key(tag_mapping, docs_path, no_pricing_filter, use_filename_tags)
+    cached_data = _load_cached_structure(cache_key)
+    if cached_data is not None:
+        print(f"Using cached PDF structure ({len(cached_data.get('pdf_structure', []))} items)")
+        _log_structure_completed(cached_data, cached=True)
+        return _finish_structure(cached_data, existing_user_edits)
+    
     print("GENERATING COMPLETE PDF STRUCTURE")
     print("="*50)
     
@@ -252,39 +385,23 @@ def enhance_tag_mapping(tag_mapping: Dict[str, str], docs_path: str, no_pricing_
     position = 1
     
     # Group files by tag
-    tag_groups = {}
+    tag_groups = defaultdict(list)
     for filename, tag in tag_mapping.items():
         if tag:  # Only include files with tags
-            if tag not in tag_groups:
-                tag_groups[tag] = []
             tag_groups[tag].append(filename)
             # Enhanced debug logging for JPG files
             if filename.lower().endswith(('.jpg', '.jpeg', '.png')):
-                print(f"  [DEBUG] JPG file mapped: {filename} -> tag: {tag}")
+                log_detail(f"JPG file mapped: {filename} -> tag: {tag}")
         else:
             # Log files without tags for debugging
             if filename.lower().endswith(('.jpg', '.jpeg', '.png')):
-                print(f"  [DEBUG] JPG file WITHOUT tag: {filename}")
+                log_detail(f"JPG file WITHOUT tag: {filename}")
     
     # Sort tags (MAU first, then AHU, numerically)
-    def sort_key(tag):
-        """Custom sort key to handle equipment tags properly"""
-        # MAU tags first (False comes before True)
-        is_ahu = tag.startswith('AHU-')
-        
-        # Extract the numeric/alphanumeric suffix
-        suffix = tag.replace('AHU-', '').replace('MAU-', '')
-        
-        # Handle numeric suffixes (including 0) vs alphanumeric
-        try:
-            # Try to convert to integer for proper numeric sorting
-            numeric_part = int(suffix.split('-')[0])  # Handle cases like "M3 3-20-2025"
-            return (is_ahu, numeric_part, suffix)
-        except ValueError:
-            # Non-numeric suffix, use string sorting with padding
-            return (is_ahu, float('inf'), suffix.zfill(10))
-    
-    sorted_tags = sorted(tag_groups.keys(), key=sort_key)
+    # Decorate-sort-undecorate: each tag's key is computed exactly once
+    keyed_tags = [(_tag_sort_key(tag), tag) for tag in tag_groups]
+    keyed_tags.sort()
+    sorted_tags = [tag for _, tag in keyed_tags]
     
     print(f"Processing {len(sorted_tags)} equipment tags: {sorted_tags}")
     
@@ -299,28 +416,36 @@ def enhance_tag_mapping(tag_mapping: Dict[str, str], docs_path: str, no_pricing_
     for tag in sorted_tags:
         files_for_tag = tag_groups[tag]
         
+        # Split names and build paths once; reused by the pricing scan,
+        # classification and converted_path generation below
+        file_stems = {fn: os.path.splitext(fn)[0] for fn in files_for_tag}
+        file_paths = {fn: os.path.join(docs_path, fn) for fn in files_for_tag}
+        
         # Check files for pricing content with smart optimization
         # When using filename tags, we only need to scan Item Summary files
-        files_with_pricing_info = []
-        scanned_count = 0
-        skipped_count = 0
+        # Non-Item Summary files rarely contain pricing when using structured filenames,
+        # so should_check_pricing_content lets us skip them (filename tags optimization)
+        candidate_files = [fn for fn in files_for_tag if should_check_pricing_content(fn, use_filename_tags)]
+        scanned_count = len(candidate_files)
+        skipped_count = len(files_for_tag) - scanned_count
         
-        for filename in files_for_tag:
-            if should_check_pricing_content(filename, use_filename_tags):
-                # This file needs pricing content scanning
-                file_path = os.path.join(docs_path, filename)
-                if has_pricing_content(file_path):
-                    files_with_pricing_info.append(filename)
-                    print(f"  [PRICING] Found pricing content in: {filename}")
-                scanned_count += 1
-            else:
-                # Skip pricing check for performance (filename tags optimization)
-                # Non-Item Summary files rarely contain pricing when using structured filenames
-                skipped_count += 1
+        # Pricing scans are I/O-bound (disk reads + zip decompression), so overlap them
+        candidate_paths = [file_paths[fn] for fn in candidate_files]
+        if len(candidate_paths) < 2:
+            pricing_results = [has_pricing_content(path) for path in candidate_paths]
+        else:
+            with ThreadPoolExecutor(max_workers=min(32, len(candidate_paths))) as executor:
+                pricing_results = list(executor.map(has_pricing_content, candidate_paths))
+        
+        files_with_pricing_info = []
+        for filename, has_pricing in zip(candidate_files, pricing_results):
+            if has_pricing:
+                files_with_pricing_info.append(filename)
+                log_detail(f"[PRICING] Found pricing content in: {filename}")
                 
         # Log performance optimization results
         if use_filename_tags and skipped_count > 0:
-            print(f"  [OPTIMIZATION] Scanned {scanned_count} files, skipped {skipped_count} (filename-based optimization)")
+            log_detail(f"[OPTIMIZATION] Scanned {scanned_count} files, skipped {skipped_count} (filename-based optimization)")
             
         # Log pricing analysis for this tag
         log_processing_stage('pricing_analysis', 'completed', {
@@ -334,6 +459,7 @@ def enhance_tag_mapping(tag_mapping: Dict[str, str], docs_path: str, no_pricing_
         
         # Use all files for the tag (we'll mark pricing files as excluded if filter is enabled)
         filtered_files = files_for_tag
+        pricing_set = set(files_with_pricing_info)
         
         # Add title page for this tag
         pdf_structure.append({
@@ -344,14 +470,12 @@ def enhance_tag_mapping(tag_mapping: Dict[str, str], docs_path: str, no_pricing_
             "include": True
         })
         position += 1
-        print(f"  [TITLE] Added title page for {tag} at position {position-1}")
+        log_detail(f"[TITLE] Added title page for {tag} at position {position-1}")
         
         # Classify and sort files within the tag
         file_info = []
         for filename in filtered_files:
-            file_type = classify_file_type(filename)
-            display_title = create_display_title(filename)
-            priority = get_file_order_priority(file_type)
+            file_type, display_title, priority = analyze_filename(filename)
             
             file_info.append({
                 'filename': filename,
@@ -368,11 +492,10 @@ def enhance_tag_mapping(tag_mapping: Dict[str, str], docs_path: str, no_pricing_
             filename = file_data['filename']
             
             # Create converted path (will be set during actual conversion)
-            base_name = os.path.splitext(filename)[0]
-            converted_path = f"converted_pdfs/{base_name}.pdf"
+            converted_path = f"converted_pdfs/{file_stems[filename]}.pdf"
             
             # Determine if this file should be included (not pricing file or pricing filter disabled)
-            is_pricing_file = filename in files_with_pricing_info
+            is_pricing_file = filename in pricing_set
             include_file = no_pricing_filter or not is_pricing_file
             
             pdf_structure.append({
@@ -391,12 +514,23 @@ def enhance_tag_mapping(tag_mapping: Dict[str, str], docs_path: str, no_pricing_
             status = "[INCLUDED]" if include_file else "[EXCLUDED - PRICING]"
             # Enhanced debug logging for JPG files
             if filename.lower().endswith(('.jpg', '.jpeg', '.png')):
-                print(f"    {status} [JPG] {filename} -> {file_data['display_title']} (Type: {file_data['file_type']}) for tag: {tag}")
+                log_detail(f"{status} [JPG] {filename} -> {file_data['display_title']} (Type: {file_data['file_type']}) for tag: {tag}")
             else:
-                print(f"    {status} {filename} -> {file_data['display_title']} (Type: {file_data['file_type']})")
+                log_detail(f"{status} {filename} -> {file_data['display_title']} (Type: {file_data['file_type']})")
+        
+        excluded_count = 0 if no_pricing_filter else len(files_with_pricing_info)
+        print(f"  [{tag}] {len(file_info)} documents, {excluded_count} excluded for pricing, "
+              f"{scanned_count} scanned / {skipped_count} skipped")
     
     # Add cut sheets section
-    cs_files = glob.glob(os.path.join(docs_path, "CS*.pdf"))
+    # One directory scan with inline name filtering (dirent type bits avoid extra stats)
+    cs_files = []
+    if os.path.isdir(docs_path):
+        with os.scandir(docs_path) as it:
+            cs_files = sorted(
+                entry.path for entry in it
+                if entry.name.startswith('CS') and entry.name.lower().endswith('.pdf') and entry.is_file()
+            )
     if cs_files:
         # Add cut sheets title page
         pdf_structure.append({
@@ -407,10 +541,10 @@ def enhance_tag_mapping(tag_mapping: Dict[str, str], docs_path: str, no_pricing_
             "include": True
         })
         position += 1
-        print(f"  [TITLE] Added CUT SHEETS title page at position {position-1}")
+        log_detail(f"[TITLE] Added CUT SHEETS title page at position {position-1}")
         
         # Add cut sheet files
-        for cs_file in sorted(cs_files):
+        for cs_file in cs_files:
             filename = os.path.basename(cs_file)
             display_title = create_display_title(filename)
             
@@ -424,22 +558,27 @@ def enhance_tag_mapping(tag_mapping: Dict[str, str], docs_path: str, no_pricing_
                 "include": True
             })
             position += 1
-            print(f"    [CUT] {filename} -> {display_title}")
+            log_detail(f"[CUT] {filename} -> {display_title}")
+        
+        print(f"  [CUT SHEETS] {len(cs_files)} cut sheets")
+    
+    # Count item types in a single pass
+    type_counts = Counter(item["type"] for item in pdf_structure)
     
     # Create the complete data structure
     enhanced_data = {
         "pdf_structure": pdf_structure,
         "metadata": {
-            "total_tags": len([item for item in pdf_structure if item["type"] == "title_page"]),
-            "total_documents": len([item for item in pdf_structure if item["type"] == "document"]),
-            "total_cut_sheets": len([item for item in pdf_structure if item["type"] == "cut_sheet"]),
+            "total_tags": type_counts["title_page"],
+            "total_documents": type_counts["document"],
+            "total_cut_sheets": type_counts["cut_sheet"],
             "total_items": len(pdf_structure),
             "processing_complete": True,
             "pricing_filter_enabled": not no_pricing_filter
         },
         # Keep legacy format for backward compatibility
         "tag_mapping": tag_mapping,
-        "tag_groups": tag_groups
+        "tag_groups": dict(tag_groups)
     }
     
     print(f"\nGenerated PDF structure with {len(pdf_structure)} total items:")
@@ -448,14 +587,27 @@ def enhance_tag_mapping(tag_mapping: Dict[str, str], docs_path: str, no_pricing_
     print(f"  - {enhanced_data['metadata']['total_cut_sheets']} cut sheets")
     
     # Log completion of structure generation
+    _log_structure_completed(enhanced_data)
+    
+    # Cache the structure before user customizations are applied
+    _save_cached_structure(cache_key, enhanced_data)
+    
+    return _finish_structure(enhanced_data, existing_user_edits)
+
+def _log_structure_completed(enhanced_data: Dict, cached: bool = False):
+    """Log the 'completed' stage of enhance_tag_mapping for a generated or cached structure"""
+    metadata = enhanced_data.get('metadata', {})
     log_processing_stage('enhance_tag_mapping', 'completed', {
-        'total_items': len(pdf_structure),
-        'total_tags': enhanced_data['metadata']['total_tags'],
-        'total_documents': enhanced_data['metadata']['total_documents'],
-        'total_cut_sheets': enhanced_data['metadata']['total_cut_sheets'],
-        'pricing_filter_enabled': enhanced_data['metadata']['pricing_filter_enabled']
+        'total_items': len(enhanced_data.get('pdf_structure', [])),
+        'total_tags': metadata.get('total_tags'),
+        'total_documents': metadata.get('total_documents'),
+        'total_cut_sheets': metadata.get('total_cut_sheets'),
+        'pricing_filter_enabled': metadata.get('pricing_filter_enabled'),
+        'cached': cached
     })
-    
+
+def _finish_structure(enhanced_data: Dict, existing_user_edits: Optional[Dict]) -> Dict:
+    """Apply user customizations to a generated (or cached) structure and snapshot it"""
     # Merge existing user customizations if they exist
     if existing_user_edits:
         enhanced_data = merge_user_customizations(enhanced_data, existing_user_edits)
@@ -466,6 +618,68 @@ def enhance_tag_mapping(tag_mapping: Dict[str, str], docs_path: str, no_pricing_
     
     return enhanced_data
 
+def _structure_cache_key(tag_mapping: Dict[str, str], docs_path: str,
+                         no_pricing_filter: bool, use_filename_tags: bool) -> Optional[str]:
+    """Hash the inputs of enhance_tag_mapping.
+    
+    The directory mtime catches added, removed and renamed files; each mapped
+    file's mtime and size catch edits in place, which leave the directory
+    mtime unchanged. Returns None (no caching) unless the cache is enabled.
+    """
+    if not STRUCTURE_CACHE_ENABLED:
+        return None
+    try:
+        dir_mtime = os.path.getmtime(docs_path)
+    except OSError:
+        return None
+    file_stats = []
+    for filename in sorted(tag_mapping):
+        try:
+            st = os.stat(os.path.join(docs_path, filename))
+            file_stats.append((filename, st.st_mtime_ns, st.st_size))
+        except OSError:
+            file_stats.append((filename, None, None))
+    key_source = repr((_STRUCTURE_CACHE_VERSION, sorted(tag_mapping.items()), docs_path,
+                       no_pricing_filter, use_filename_tags, dir_mtime, file_stats))
+    return hashlib.blake2b(key_source.encode('utf-8'), digest_size=16).hexdigest()
+
+def _load_cached_structure(cache_key: Optional[str]) -> Optional[Dict]:
+    """Load a cached structure, or None on a miss"""
+    if cache_key is None:
+        return None
+    cache_path = os.path.join(_STRUCTURE_CACHE_DIR, f"{cache_key}.json")
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        # Touch the entry so pruning keeps recently used structures
+        os.utime(cache_path)
+        return data
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable structure cache {cache_path}: {e}")
+        return None
+
+def _save_cached_structure(cache_key: Optional[str], enhanced_data: Dict):
+    """Write a structure to the cache and prune it to the most recent entries"""
+    if cache_key is None:
+        return
+    try:
+        os.makedirs(_STRUCTURE_CACHE_DIR, mode=0o700, exist_ok=True)
+        cache_path = os.path.join(_STRUCTURE_CACHE_DIR, f"{cache_key}.json")
+        temp_path = cache_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(enhanced_data, f, ensure_ascii=False)
+        os.replace(temp_path, cache_path)
+        
+        with os.scandir(_STRUCTURE_CACHE_DIR) as it:
+            entries = [e for e in it if e.name.endswith('.json') and e.is_file()]
+        entries.sort(key=lambda e: e.stat().st_mtime, reverse=True)
+        for stale in entries[_STRUCTURE_CACHE_SIZE:]:
+            os.remove(stale.path)
+    except OSError as e:
+        logger.warning(f"Could not write structure cache: {e}")
+
 def print_enhanced_summary(data: Dict):
     """Print enhanced summary of the PDF structure"""
     pdf_structure = data.get('pdf_structure', [])
@@ -504,13 +718,11 @@ def print_enhanced_summary(data: Dict):
 # Legacy function for backward compatibility
 def create_tag_groups(tag_mapping: Dict[str, str]) -> Dict[str, list]:
     """Create tag groups from mapping (legacy compatibility)"""
-    tag_groups = {}
+    tag_groups = defaultdict(list)
     for filename, tag in tag_mapping.items():
         if tag:
-            if tag not in tag_groups:
-                tag_groups[tag] = []
             tag_groups[tag].append(filename)
-    return tag_groups
+    return dict(tag_groups)
 
 if __name__ == "__main__":
     # Test the enhanced document processor
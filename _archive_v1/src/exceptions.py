@@ -4,29 +4,116 @@ Custom exception classes for DST Submittals Generator
 Provides domain-specific exceptions with error codes and remediation guidance
 """
 
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Callable, List, Mapping
+import json
 import os
+import sys
+
+# Optional faster JSON encoder for batched structured logging
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Set DST_VERBOSE_EXCEPTIONS=0 to skip building remediation text, e.g. for
+# silent retry/fallback paths that never display it
+VERBOSE_EXCEPTIONS = os.environ.get('DST_VERBOSE_EXCEPTIONS', '1') == '1'
+
+
+def _remediation_table(entries: Dict[str, str]) -> Mapping[str, str]:
+    """Freeze a remediation table, interning its strings so repeated errors
+    (and log de-dup comparisons) share one object per message"""
+    return MappingProxyType({key: sys.intern(text) for key, text in entries.items()})
+
+
+# Remediation guidance, keyed by dependency / conversion method / resource
+_DEP_REMEDIATION: Mapping[str, str] = _remediation_table({
+    'OfficeToPDF': "Download OfficeToPDF.exe and set DST_OFFICETOPDF_PATH environment variable",
+    'Word': "Install Microsoft Word and ensure COM automation is enabled",
+    'LibreOffice': "Install LibreOffice and ensure it's in your system PATH",
+    'python-docx': "Install required Python packages: pip install -r requirements.txt"
+})
+
+_PDF_REMEDIATION: Mapping[str, str] = _remediation_table({
+    'officetopdf': "Check if OfficeToPDF.exe is accessible and document format is supported",
+    'word_com': "Ensure Microsoft Word is properly installed and not in use by another process",
+    'docx2pdf': "Verify document is not corrupted and Word is available",
+    'libreoffice': "Check if LibreOffice is installed and document format is supported"
+})
+
+_RESOURCE_REMEDIATION: Mapping[str, str] = _remediation_table({
+    'memory': "Reduce batch size or close other applications to free memory",
+    'disk_space': "Free up disk space or change output directory",
+    'file_handles': "Reduce concurrent operations or restart the application"
+})
 
 
 class DSTError(Exception):
     """Base exception class for DST Submittals Generator"""
     
+    # Default error code is the class name, stored once per class; an explicit
+    # error_code passed to __init__ overrides it on the instance
+    error_code = 'DSTError'
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.error_code = cls.__name__
+    
     def __init__(self, message: str, error_code: str = None, remediation: str = None, 
                  context: Dict[str, Any] = None):
-        super().__init__(message)
-        self.error_code = error_code or self.__class__.__name__
+        # Same effect as Exception.__init__(message), without the extra call
+        self.args = (message,)
+        if error_code is not None:
+            self.error_code = error_code
         self.remediation = remediation
-        self.context = context or {}
+        # The context dict is only allocated on first access
+        self._context = context
+    
+    @property
+    def context(self) -> Dict[str, Any]:
+        """Structured context; the dict is created on first access"""
+        if self._context is None:
+            self._context = {}
+        return self._context
+    
+    @context.setter
+    def context(self, value: Dict[str, Any]):
+        self._context = value
+    
+    @classmethod
+    def ensure(cls, error: Exception, context: Dict[str, Any] = None) -> 'DSTError':
+        """Return error as-is if it is already a cls instance, otherwise convert it"""
+        if error.__class__ is cls or isinstance(error, cls):
+            return error
+        return create_exception_from_error(error, context)
+    
+    def _ctx_set(self, key: str, value: Any):
+        """Set a context field, creating the context dict on first write"""
+        # Keys are identifier-like string literals, which CPython interns at
+        # compile time, so dict stores already hit the identity fast path
+        if self._context is None:
+            self._context = {}
+        self._context[key] = value
         
     def to_dict(self) -> Dict[str, Any]:
         """Convert exception to dictionary for structured logging"""
         return {
-            'error_type': self.__class__.__name__,
+            'error_type': type(self).__name__,
             'error_code': self.error_code,
-            'message': str(self),
+            'message': self.args[0] if self.args else '',
             'remediation': self.remediation,
-            'context': self.context
+            'context': dict(self.context)
         }
+    
+    @classmethod
+    def batch_to_json(cls, errors: List['DSTError']) -> bytes:
+        """Serialize many exceptions to one JSON array in a single encoder call"""
+        payload = [error.to_dict() for error in errors]
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(payload, default=str)
+        return json.dumps(payload, default=str).encode('utf-8')
 
 
 class ConfigurationError(DSTError):
@@ -35,119 +122,112 @@ class ConfigurationError(DSTError):
     def __init__(self, message: str, setting_name: str = None, **kwargs):
         super().__init__(message, **kwargs)
         if setting_name:
-            self.context['setting_name'] = setting_name
+            self._ctx_set('setting_name', setting_name)
 
 
 class PathNotFoundError(DSTError):
     """File or directory path not found"""
     
+    # path/operation are kept as attributes; the context dict is only built on first access
     def __init__(self, path: str, operation: str = None, **kwargs):
-        message = f"Path not found: {path}"
-        if operation:
-            message = f"Path not found for {operation}: {path}"
+        message = (f"Path not found for {operation}: {path}"
+                   if operation else f"Path not found: {path}")
             
-        remediation = f"Please verify the path exists and is accessible: {path}"
+        remediation = f"Please verify the path exists and is accessible: {path}" if VERBOSE_EXCEPTIONS else None
         
         super().__init__(message, remediation=remediation, **kwargs)
-        self.context['path'] = path
-        self.context['operation'] = operation
+        self.path = path
+        self.operation = operation
+        self._context_built = False
+    
+    @DSTError.context.getter
+    def context(self) -> Dict[str, Any]:
+        """Any caller-supplied context, followed by path and operation.
+        
+        Built once, so later writes to it are kept like on other errors.
+        """
+        if not self._context_built:
+            self._context = {**(self._context or {}), 'path': self.path, 'operation': self.operation}
+            self._context_built = True
+        return self._context
 
 
 class DependencyNotFoundError(DSTError):
     """Required dependency not found"""
     
     def __init__(self, dependency: str, operation: str = None, **kwargs):
-        message = f"Required dependency not found: {dependency}"
-        if operation:
-            message = f"Required dependency for {operation} not found: {dependency}"
+        message = (f"Required dependency for {operation} not found: {dependency}"
+                   if operation else f"Required dependency not found: {dependency}")
             
-        remediation_map = {
-            'OfficeToPDF': "Download OfficeToPDF.exe and set DST_OFFICETOPDF_PATH environment variable",
-            'Word': "Install Microsoft Word and ensure COM automation is enabled",
-            'LibreOffice': "Install LibreOffice and ensure it's in your system PATH",
-            'python-docx': "Install required Python packages: pip install -r requirements.txt"
-        }
-        
-        remediation = remediation_map.get(dependency, f"Install or configure {dependency}")
+        remediation = _DEP_REMEDIATION.get(dependency, f"Install or configure {dependency}") if VERBOSE_EXCEPTIONS else None
         
         super().__init__(message, remediation=remediation, **kwargs)
-        self.context['dependency'] = dependency
-        self.context['operation'] = operation
+        self._ctx_set('dependency', dependency)
+        self._ctx_set('operation', operation)
 
 
 class TagExtractionError(DSTError):
     """Tag extraction from documents failed"""
     
     def __init__(self, filename: str, method: str = None, **kwargs):
-        message = f"Failed to extract tag from document: {filename}"
-        if method:
-            message = f"Failed to extract tag from {filename} using {method}"
+        message = (f"Failed to extract tag from {filename} using {method}"
+                   if method else f"Failed to extract tag from document: {filename}")
             
         remediation = (
             "Verify the document contains equipment tags (AHU-1, MAU-12, etc.) "
             "in a recognizable format. Check if file is corrupted or password protected."
-        )
+        ) if VERBOSE_EXCEPTIONS else None
         
         super().__init__(message, remediation=remediation, **kwargs)
-        self.context['filename'] = filename
-        self.context['method'] = method
+        self._ctx_set('filename', filename)
+        self._ctx_set('method', method)
 
 
 class PDFConversionError(DSTError):
     """PDF conversion failed"""
     
     def __init__(self, filename: str, method: str = None, original_error: Exception = None, **kwargs):
-        message = f"Failed to convert document to PDF: {filename}"
-        if method:
-            message = f"Failed to convert {filename} to PDF using {method}"
+        message = (f"Failed to convert {filename} to PDF using {method}"
+                   if method else f"Failed to convert document to PDF: {filename}")
             
-        remediation_map = {
-            'officetopdf': "Check if OfficeToPDF.exe is accessible and document format is supported",
-            'word_com': "Ensure Microsoft Word is properly installed and not in use by another process",
-            'docx2pdf': "Verify document is not corrupted and Word is available",
-            'libreoffice': "Check if LibreOffice is installed and document format is supported"
-        }
-        
-        remediation = remediation_map.get(method, 
-            "Try different conversion methods or check if document is corrupted")
+        remediation = _PDF_REMEDIATION.get(method, 
+            "Try different conversion methods or check if document is corrupted") if VERBOSE_EXCEPTIONS else None
         
         super().__init__(message, remediation=remediation, **kwargs)
-        self.context['filename'] = filename
-        self.context['method'] = method
+        self._ctx_set('filename', filename)
+        self._ctx_set('method', method)
         if original_error:
-            self.context['original_error'] = str(original_error)
+            self._ctx_set('original_error', str(original_error))
 
 
 class DocumentProcessingError(DSTError):
     """General document processing errors"""
     
     def __init__(self, operation: str, filename: str = None, **kwargs):
-        message = f"Document processing failed: {operation}"
-        if filename:
-            message = f"Document processing failed for {filename}: {operation}"
+        message = (f"Document processing failed for {filename}: {operation}"
+                   if filename else f"Document processing failed: {operation}")
             
         super().__init__(message, **kwargs)
-        self.context['operation'] = operation
-        self.context['filename'] = filename
+        self._ctx_set('operation', operation)
+        self._ctx_set('filename', filename)
 
 
 class COMAutomationError(DSTError):
     """COM automation specific errors"""
     
     def __init__(self, operation: str, com_object: str = None, **kwargs):
-        message = f"COM automation failed: {operation}"
-        if com_object:
-            message = f"COM automation failed for {com_object}: {operation}"
+        message = (f"COM automation failed for {com_object}: {operation}"
+                   if com_object else f"COM automation failed: {operation}")
             
         remediation = (
             "Ensure Microsoft Office applications are properly installed and not in use. "
             "Try closing all Office applications and running again. "
             "If the problem persists, restart the system to reset COM registration."
-        )
+        ) if VERBOSE_EXCEPTIONS else None
         
         super().__init__(message, remediation=remediation, **kwargs)
-        self.context['operation'] = operation
-        self.context['com_object'] = com_object
+        self._ctx_set('operation', operation)
+        self._ctx_set('com_object', com_object)
 
 
 class FileAccessError(DSTError):
@@ -160,98 +240,142 @@ class FileAccessError(DSTError):
             f"Check if file is not open in another application. "
             f"Verify read/write permissions for: {filename}. "
             f"Ensure the file is not locked by another process."
-        )
+        ) if VERBOSE_EXCEPTIONS else None
         
         super().__init__(message, remediation=remediation, **kwargs)
-        self.context['filename'] = filename
-        self.context['operation'] = operation
+        self._ctx_set('filename', filename)
+        self._ctx_set('operation', operation)
 
 
 class ProcessExecutionError(DSTError):
     """External process execution errors"""
     
     def __init__(self, command: str, return_code: int = None, stderr: str = None, **kwargs):
-        message = f"Process execution failed: {command}"
-        if return_code is not None:
-            message = f"Process execution failed with code {return_code}: {command}"
+        message = (f"Process execution failed with code {return_code}: {command}"
+                   if return_code is not None else f"Process execution failed: {command}")
             
-        remediation = (
-            f"Check if the command is available in system PATH: {command.split()[0]}. "
-            f"Verify file permissions and that all required dependencies are installed."
-        )
+        exe = command.partition(' ')[0]
+        remediation = (f"Check if the command is available in system PATH: {exe}. "
+                       "Verify file permissions and that all required dependencies are installed."
+                       if VERBOSE_EXCEPTIONS else None)
         
         super().__init__(message, remediation=remediation, **kwargs)
-        self.context['command'] = command
-        self.context['return_code'] = return_code
-        self.context['stderr'] = stderr
+        self._ctx_set('command', command)
+        self._ctx_set('return_code', return_code)
+        self._ctx_set('stderr', stderr)
 
 
 class ValidationError(DSTError):
     """Data validation errors"""
     
     def __init__(self, field: str, value: Any, expected: str = None, **kwargs):
-        message = f"Validation failed for {field}: {value}"
-        if expected:
-            message = f"Validation failed for {field}: expected {expected}, got {value}"
+        message = (f"Validation failed for {field}: expected {expected}, got {value}"
+                   if expected else f"Validation failed for {field}: {value}")
             
         super().__init__(message, **kwargs)
-        self.context['field'] = field
-        self.context['value'] = value
-        self.context['expected'] = expected
+        self._ctx_set('field', field)
+        self._ctx_set('value', value)
+        self._ctx_set('expected', expected)
 
 
 class PipelineError(DSTError):
     """Pipeline execution errors"""
     
     def __init__(self, stage: str, operation: str = None, files_processed: int = None, **kwargs):
-        message = f"Pipeline failed at stage: {stage}"
-        if operation:
-            message = f"Pipeline failed at stage {stage} during {operation}"
+        message = (f"Pipeline failed at stage {stage} during {operation}"
+                   if operation else f"Pipeline failed at stage: {stage}")
             
         super().__init__(message, **kwargs)
-        self.context['stage'] = stage
-        self.context['operation'] = operation
-        self.context['files_processed'] = files_processed
+        self._ctx_set('stage', stage)
+        self._ctx_set('operation', operation)
+        self._ctx_set('files_processed', files_processed)
 
 
 class ResourceExhaustionError(DSTError):
     """System resource exhaustion errors"""
     
     def __init__(self, resource: str, operation: str = None, **kwargs):
-        message = f"Resource exhaustion: {resource}"
-        if operation:
-            message = f"Resource exhaustion during {operation}: {resource}"
+        message = (f"Resource exhaustion during {operation}: {resource}"
+                   if operation else f"Resource exhaustion: {resource}")
             
-        remediation_map = {
-            'memory': "Reduce batch size or close other applications to free memory",
-            'disk_space': "Free up disk space or change output directory",
-            'file_handles': "Reduce concurrent operations or restart the application"
-        }
-        
-        remediation = remediation_map.get(resource, f"Free up {resource} and try again")
+        remediation = _RESOURCE_REMEDIATION.get(resource, f"Free up {resource} and try again") if VERBOSE_EXCEPTIONS else None
         
         super().__init__(message, remediation=remediation, **kwargs)
-        self.context['resource'] = resource
-        self.context['operation'] = operation
+        self._ctx_set('resource', resource)
+        self._ctx_set('operation', operation)
 
 
 class PDFAssemblyError(DSTError):
     """PDF assembly and final document creation errors"""
     
     def __init__(self, operation: str, filename: str = None, **kwargs):
-        message = f"PDF assembly failed: {operation}"
-        if filename:
-            message = f"PDF assembly failed for {filename}: {operation}"
+        message = (f"PDF assembly failed for {filename}: {operation}"
+                   if filename else f"PDF assembly failed: {operation}")
             
         remediation = (
             "Check if all required PDF files exist and are accessible. "
             "Verify sufficient disk space for final PDF creation. "
             "Ensure no other process is using the output file."
-        )
+        ) if VERBOSE_EXCEPTIONS else None
         
         super().__init__(message, remediation=remediation, **kwargs)
-        self.context['operation'] = operation
-        self.context['filename'] = filename
+        self._ctx_set('operation', operation)
+        self._ctx_set('filename', filename)
+
+
+def _make_path_error(error: Exception, context: Dict[str, Any]) -> DSTError:
+    return PathNotFoundError(
+        path=context.get('path', 'unknown'),
+        operation=context.get('operation', 'file access'),
+        context=context
+    )
+
+
+def _make_access_error(error: Exception, context: Dict[str, Any]) -> DSTError:
+    return FileAccessError(
+        filename=context.get('filename', 'unknown'),
+        operation=context.get('operation', 'file access'),
+        context=context
+    )
+
+
+def _make_dependency_error(error: Exception, context: Dict[str, Any]) -> DSTError:
+    error_message = str(error)
+    dependency = error_message.rpartition(' ')[2] if error_message else 'unknown'
+    return DependencyNotFoundError(
+        dependency=dependency,
+        operation=context.get('operation'),
+        context=context
+    )
+
+
+def _make_validation_error(error: Exception, context: Dict[str, Any]) -> DSTError:
+    return ValidationError(
+        field=context.get('field', 'unknown'),
+        value=context.get('value', str(error)),
+        context=context
+    )
+
+
+def _make_generic_error(error: Exception, context: Dict[str, Any]) -> DSTError:
+    # Generic DST error for unknown exception types
+    error_type = type(error).__name__
+    return DSTError(
+        message=f"{error_type}: {error}",
+        error_code=error_type,
+        context=context
+    )
+
+
+# Map common exception types to DST exception factories; subclasses are
+# resolved through the MRO on first sight and cached here
+_EXC_DISPATCH: Dict[type, Callable[[Exception, Dict[str, Any]], DSTError]] = {
+    FileNotFoundError: _make_path_error,
+    PermissionError: _make_access_error,
+    ImportError: _make_dependency_error,
+    ValueError: _make_validation_error,
+    TypeError: _make_validation_error,
+}
 
 
 def create_exception_from_error(error: Exception, context: Dict[str, Any] = None) -> DSTError:
@@ -262,71 +386,13 @@ def create_exception_from_error(error: Exception, context: Dict[str, Any] = None
     if isinstance(error, DSTError):
         return error
     
-    error_type = type(error).__name__
-    error_message = str(error)
-    
-    # Map common exception types to DST exceptions
-    if isinstance(error, FileNotFoundError):
-        return PathNotFoundError(
-            path=context.get('path', 'unknown'),
-            operation=context.get('operation', 'file access'),
-            context=context
-        )
-    
-    elif isinstance(error, PermissionError):
-        return FileAccessError(
-            filename=context.get('filename', 'unknown'),
-            operation=context.get('operation', 'file access'),
-            context=context
-        )
-    
-    elif isinstance(error, ImportError):
-        dependency = error_message.split()[-1] if error_message else 'unknown'
-        return DependencyNotFoundError(
-            dependency=dependency,
-            operation=context.get('operation'),
-            context=context
-        )
-    
-    elif isinstance(error, (ValueError, TypeError)):
-        return ValidationError(
-            field=context.get('field', 'unknown'),
-            value=context.get('value', error_message),
-            context=context
-        )
-    
-    else:
-        # Generic DST error for unknown exception types
-        return DSTError(
-            message=f"{error_type}: {error_message}",
-            error_code=error_type,
-            context=context
+    error_class = type(error)
+    factory = _EXC_DISPATCH.get(error_class)
+    if factory is None:
+        factory = next(
+            (_EXC_DISPATCH[base] for base in error_class.__mro__ if base in _EXC_DISPATCH),
+            _make_generic_error
         )
-
-
-if __name__ == "__main__":
-    # Test the exception classes
-    
-    # Test basic exception
-    try:
-        raise PathNotFoundError("/nonexistent/path", "file conversion")
-    except DSTError as e:
-        print("Exception details:")
-        print(f"  Type: {type(e).__name__}")
-        print(f"  Message: {e}")
-        print(f"  Remediation: {e.remediation}")
-        print(f"  Context: {e.context}")
-        print(f"  Dict representation: {e.to_dict()}")
-    
-    print("\n" + "="*50 + "\n")
+        _EXC_DISPATCH[error_class] = factory
     
-    # Test exception conversion
-    try:
-        raise FileNotFoundError("Test file not found")
-    except Exception as e:
-        dst_error = create_exception_from_error(e, {'path': '/test/file.txt', 'operation': 'read'})
-        print("Converted exception:")
-        print(f"  Type: {type(dst_error).__name__}")
-        print(f"  Message: {dst_error}")
-        print(f"  Remediation: {dst_error.remediation}")
-        print(f"  Context: {dst_error.context}")
\ No newline at end of file
+    return factory(error, context)
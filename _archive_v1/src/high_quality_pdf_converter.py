@@ -5,12 +5,21 @@ Supports both .doc and .docx files with multiple conversion methods
 """
 
 import os
+import io
+import sys
+import multiprocessing
+import atexit
+import hashlib
+import functools
+import socket
 import subprocess
 import shutil
+import tempfile
+import threading
+import zipfile
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Tuple
 import json
-from docx2pdf import convert as docx2pdf_convert
 import pypdf
 from pypdf import PdfReader, PdfWriter
 import re
@@ -19,11 +28,16 @@ from PIL import Image
 import time
 
 try:
-    import win32com.client
-    import pythoncom
-    WORD_AVAILABLE = True
+    import img2pdf
+    IMG2PDF_AVAILABLE = True
 except ImportError:
-    WORD_AVAILABLE = False
+    IMG2PDF_AVAILABLE = False
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
 
 # Import config to get OfficeToPDF path
 try:
@@ -31,25 +45,180 @@ try:
 except ImportError:
     from config import Config
 
+# LibreOffice executable names, in lookup order
+LIBREOFFICE_COMMANDS = ['soffice', 'libreoffice', 'libreoffice.exe', 'soffice.exe']
+
+# Persistent LibreOffice listener (unoserver owns the soffice UNO socket,
+# unoconvert clients talk to unoserver); each converter picks free ports
+LO_LISTENER_HOST = '127.0.0.1'
+LO_LISTENER_STARTUP_TIMEOUT = 30
+# Recycle the listener after this many conversions to bound LibreOffice memory growth
+LO_RESTART_THRESHOLD = 50
+
+# Documents per soffice invocation when batching one-shot conversions
+LO_BATCH_SIZE = 10
+
+# Persistent conversion cache, stored in the output directory
+CONVERSION_CACHE_FILE = '.conv_cache.json'
+
+# Parallel conversion workers
+MAX_CONVERSION_WORKERS = min(8, os.cpu_count() or 2)
+
+# Images larger than this (in pixels, longest side) are downscaled before PDF embedding
+MAX_IMAGE_DIMENSION = 2000
+
+# qpdf, when installed, writes filtered PDFs without loading them into memory
+QPDF_CMD = shutil.which('qpdf')
+
+# PDFs up to this size are read into memory in one go before parsing
+MAX_IN_MEMORY_PDF_SIZE = 100 * 1024 * 1024
+
+# Pricing-page scans are split across processes only for PDFs this long
+PARALLEL_FILTER_MIN_PAGES = 16
+
+@functools.lru_cache(maxsize=None)
+def _which(cmd: str) -> Optional[str]:
+    """shutil.which, memoized for the life of the process.
+    
+    Converters are created per run (and per request in the web interface);
+    PATH doesn't change underneath them, so each lookup is done once.
+    """
+    return shutil.which(cmd)
+
+# Word automation modules are only imported when first needed, so LibreOffice-only
+# (Linux/macOS) runs never load pywin32 or docx2pdf
+
+@functools.lru_cache(maxsize=None)
+def _load_word_com():
+    """Import pywin32's COM modules; returns (win32com.client, pythoncom) or None"""
+    try:
+        import win32com.client
+        import pythoncom
+        return win32com.client, pythoncom
+    except ImportError:
+        return None
+
+def _word_available() -> bool:
+    """Whether Word COM automation (pywin32) can be used"""
+    return _load_word_com() is not None
+
+@functools.lru_cache(maxsize=None)
+def _load_docx2pdf():
+    """Import docx2pdf's convert function, or None if docx2pdf isn't installed"""
+    try:
+        from docx2pdf import convert
+        return convert
+    except ImportError:
+        return None
+
+def _free_ports(count: int) -> List[int]:
+    """Return count distinct TCP ports on LO_LISTENER_HOST that are currently free"""
+    sockets = []
+    try:
+        for _ in range(count):
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sockets.append(sock)
+            sock.bind((LO_LISTENER_HOST, 0))
+        return [sock.getsockname()[1] for sock in sockets]
+    finally:
+        for sock in sockets:
+            sock.close()
+
+def _copy_file_data(src: str, dst: str):
+    """Copy src to the new file dst with in-kernel copy_file_range, else shutil.copy2"""
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                shutil.copystat(src, dst)
+                return
+        except OSError:
+            pass
+    
+    shutil.copy2(src, dst)
+
+def _fast_copy(src: str, dst: str):
+    """Copy a file cheaply: hardlink, then in-kernel copy_file_range, then shutil.copy2.
+    
+    Only use for outputs that are never modified in place, since a hardlink
+    shares data with the source. Every method writes a temporary name that
+    replaces dst, so an existing dst (possibly a hardlink to an earlier
+    run's source) is never truncated and a failed copy leaves no partial file.
+    """
+    if os.path.exists(dst):
+        try:
+            if os.path.samefile(src, dst):
+                return
+        except OSError:
+            pass
+    
+    tmp_dst = f"{dst}.tmp{os.getpid()}_{threading.get_ident()}"
+    try:
+        # A leftover from an interrupted copy may itself be a hardlink
+        if os.path.lexists(tmp_dst):
+            os.remove(tmp_dst)
+        try:
+            os.link(src, tmp_dst)
+        except OSError:
+            _copy_file_data(src, tmp_dst)
+        os.replace(tmp_dst, dst)
+    except BaseException:
+        if os.path.lexists(tmp_dst):
+            os.remove(tmp_dst)
+        raise
+
 class DocumentPDFConverter:
+    # Only flag pages that contain pricing information: $ followed by numbers
+    _PRICE_RE = re.compile(r'\$\s*[\d,]+\.?\d*')
+    # Simple-font encodings where '$' is always byte 0x24 in the content stream
+    _ASCII_ENCODINGS = frozenset(['/WinAnsiEncoding', '/StandardEncoding', '/MacRomanEncoding'])
+    # Price pattern in raw content-stream bytes, and inline-image operator whose
+    # binary payload could produce false matches
+    _RAW_PRICE_RE = re.compile(rb'\$\s*\d')
+    # '$' written as an octal escape in a string: \044 or the short form \44
+    _DOLLAR_ESCAPE_RE = re.compile(rb'\\0?44(?![0-7])')
+    _INLINE_IMAGE_RE = re.compile(rb'(?:^|\s)BI\s')
+    # Markup stripped from .docx part XML before the pre-conversion price check
+    _XML_TAG_RE = re.compile(rb'<[^>]*>')
+
     def check_libreoffice_available(self) -> bool:
-        """Check if LibreOffice is available"""
+        """Check if LibreOffice is available, remembering the resolved command"""
+        self._soffice_cmd = None
         try:
-            # Try different LibreOffice command names
-            commands = ['soffice', 'libreoffice', 'libreoffice.exe', 'soffice.exe']
-            for cmd in commands:
-                if shutil.which(cmd):
+            for cmd in LIBREOFFICE_COMMANDS:
+                path = _which(cmd)
+                if path:
+                    self._soffice_cmd = path
                     return True
             return False
         except Exception:
             return False
 
+    def _find_libreoffice(self) -> Optional[str]:
+        """Return the LibreOffice executable resolved at start-up"""
+        return self._soffice_cmd
+
     def __init__(self, docs_path: str, output_dir: str = "converted_pdfs"):
         self.docs_path = docs_path
         self.output_dir = output_dir
         self.conversion_log = []
         self.libreoffice_available = self.check_libreoffice_available()
-        self.word_available = WORD_AVAILABLE
+        
+        # Resolve the remaining helper executables once rather than per conversion
+        self._unoserver_cmd = _which('unoserver')
+        self._unoconvert_cmd = _which('unoconvert')
+        self._unoconv_cmd = _which('unoconv')
+        
+        # docx2pdf drives Word (COM on Windows, AppleScript on macOS) and cannot work elsewhere
+        self._is_windows = sys.platform == 'win32'
+        self._docx2pdf_supported = sys.platform in ('win32', 'darwin')
+        self.word_available = self._is_windows and _word_available()
         
         # Load configuration
         self.config = Config()
@@ -58,9 +227,43 @@ class DocumentPDFConverter:
         # Check if OfficeToPDF is available
         self.officetopdf_available = os.path.exists(self.officetopdf_path) if self.officetopdf_path else False
         
+        # Persistent LibreOffice listener, started on first use
+        self._lo_proc = None
+        self._lo_port = None
+        self._lo_profile_dir = None
+        self._lo_lock = threading.Lock()
+        self._lo_conversions_since_restart = 0
+        self._lo_restart_threshold = LO_RESTART_THRESHOLD
+        # Recycling waits for in-flight unoconvert calls to finish; the
+        # generation tells failures on an already-replaced listener apart
+        self._lo_cond = threading.Condition(self._lo_lock)
+        self._lo_in_flight = 0
+        self._lo_generation = 0
+        self._lo_recycle_reason = None
+        
+        # One-shot soffice calls use a per-thread profile so parallel workers
+        # don't hand their documents off to each other's running instance
+        self._lo_thread_local = threading.local()
+        self._lo_thread_profiles = []
+        
+        # Process pool for scanning long PDFs for pricing, started on first use
+        self._filter_pool = None
+        
+        # name -> path index of docs_path, built per convert_all_documents run
+        self._docs_index = None
+        
+        # Cached Word COM instance and the thread that owns it, started on first use
+        self._word = None
+        self._word_executor = None
+        
         # Create output directory
         os.makedirs(self.output_dir, exist_ok=True)
         
+        # Content-hash cache of previous conversions
+        self._cache_path = os.path.join(self.output_dir, CONVERSION_CACHE_FILE)
+        self._cache_lock = threading.Lock()
+        self._load_conversion_cache()
+        
     def log_conversion(self, filename: str, method: str, success: bool, output_path: str = None, error: str = None):
         """Log conversion attempts"""
         log_entry = {
@@ -72,30 +275,293 @@ class DocumentPDFConverter:
         }
         self.conversion_log.append(log_entry)
 
-    def _kill_soffice_processes(self):
-        """Kill any running soffice (LibreOffice) processes."""
+    def _lo_listener_ready(self) -> bool:
+        """Check whether the LibreOffice listener accepts connections"""
         try:
-            import platform
-            if platform.system() == "Windows":
-                # Windows: Use taskkill to terminate LibreOffice processes
-                subprocess.run(["taskkill", "/F", "/IM", "soffice.exe"], 
-                             capture_output=True, check=False)
-                subprocess.run(["taskkill", "/F", "/IM", "soffice.bin"], 
-                             capture_output=True, check=False)
-                print(f"  [LibreOffice] Killed Windows soffice processes")
-            else:
-                # Linux/Mac: Use original pgrep/kill approach
-                pids = subprocess.check_output(["pgrep", "soffice"]).decode().strip().split('\n')
-                for pid in pids:
-                    if pid:
-                        print(f"  [LibreOffice] Killing soffice process: {pid}")
-                        subprocess.run(["kill", "-9", pid], capture_output=True)
-        except subprocess.CalledProcessError:
-            # Process not found - this is normal
-            pass
-        except Exception as e:
-            print(f"  [ERROR] Failed to kill soffice processes: {e}")
+            with socket.create_connection((LO_LISTENER_HOST, self._lo_port), timeout=1):
+                return True
+        except OSError:
+            return False
+
+    def _start_lo_listener(self) -> bool:
+        """Start a long-lived headless LibreOffice listener for unoconvert clients.
+        
+        Returns True when the listener is running and reachable. Requires the
+        unoserver package (unoserver and unoconvert on PATH). Each start picks
+        free ports, so converters in the same process never share a listener.
+        """
+        with self._lo_lock:
+            if self._lo_proc is not None and self._lo_proc.poll() is None:
+                return True
+            
+            soffice = self._find_libreoffice()
+            if not soffice or not self._unoserver_cmd or not self._unoconvert_cmd:
+                return False
+            
+            self._lo_profile_dir = tempfile.mkdtemp(prefix='lo_profile_')
+            try:
+                self._lo_port, uno_port = _free_ports(2)
+                print(f"  [LibreOffice] Starting listener on {LO_LISTENER_HOST}:{self._lo_port}")
+                self._lo_proc = subprocess.Popen([
+                    self._unoserver_cmd, '--executable', soffice,
+                    '--interface', LO_LISTENER_HOST, '--port', str(self._lo_port),
+                    '--uno-port', str(uno_port),
+                    '--user-installation', Path(self._lo_profile_dir).as_uri()
+                ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            except OSError as e:
+                print(f"  [ERROR] Failed to start LibreOffice listener: {e}")
+                self._lo_proc = None
+                shutil.rmtree(self._lo_profile_dir, ignore_errors=True)
+                return False
+            # Registered only while the listener runs, so stopped converters
+            # aren't kept alive by atexit
+            atexit.register(self._stop_lo_listener)
+            
+            deadline = time.monotonic() + LO_LISTENER_STARTUP_TIMEOUT
+            while time.monotonic() < deadline:
+                if self._lo_proc.poll() is not None:
+                    break
+                if self._lo_listener_ready():
+                    return True
+                time.sleep(0.2)
+            
+            print(f"  [ERROR] LibreOffice listener did not become ready")
+        self._stop_lo_listener()
+        return False
+
+    def _stop_lo_listener(self):
+        """Terminate the LibreOffice listener and remove its profile directory"""
+        with self._lo_lock:
+            proc, self._lo_proc = self._lo_proc, None
+            atexit.unregister(self._stop_lo_listener)
+            if proc is not None and proc.poll() is None:
+                # unoserver runs soffice as a child; collect it up front so a
+                # hung listener doesn't leave an orphaned soffice behind
+                children = []
+                if PSUTIL_AVAILABLE:
+                    try:
+                        children = psutil.Process(proc.pid).children(recursive=True)
+                    except psutil.Error:
+                        pass
+                proc.terminate()
+                try:
+                    proc.wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                for child in children:
+                    try:
+                        child.kill()
+                    except psutil.Error:
+                        pass
+            if self._lo_profile_dir:
+                shutil.rmtree(self._lo_profile_dir, ignore_errors=True)
+                self._lo_profile_dir = None
+            self._lo_conversions_since_restart = 0
+            self._lo_generation += 1
+
+    def _thread_lo_profile(self) -> str:
+        """Return this thread's LibreOffice profile URI, creating it on first use"""
+        profile = getattr(self._lo_thread_local, 'profile', None)
+        if profile is None:
+            profile = tempfile.mkdtemp(prefix='lo_prof_')
+            self._lo_thread_local.profile = profile
+            with self._lo_lock:
+                self._lo_thread_profiles.append(profile)
+        return Path(profile).as_uri()
+
+    def _discard_thread_lo_profile(self):
+        """Drop this thread's profile after a failed soffice run.
+        
+        A timed-out or crashed soffice can leave the profile locked or half
+        written, which would fail every later conversion on this worker; the
+        next call creates a fresh one.
+        """
+        profile = getattr(self._lo_thread_local, 'profile', None)
+        if profile is None:
+            return
+        self._lo_thread_local.profile = None
+        with self._lo_lock:
+            if profile in self._lo_thread_profiles:
+                self._lo_thread_profiles.remove(profile)
+        shutil.rmtree(profile, ignore_errors=True)
+
+    def _cleanup_thread_profiles(self):
+        """Remove the per-thread LibreOffice profiles"""
+        with self._lo_lock:
+            profiles, self._lo_thread_profiles = self._lo_thread_profiles, []
+        for profile in profiles:
+            shutil.rmtree(profile, ignore_errors=True)
+        self._lo_thread_local = threading.local()
+
+    def _begin_lo_conversion(self) -> Optional[int]:
+        """Register an unoconvert call, starting the listener if needed.
+        
+        Waits while a recycle is pending. Returns the listener generation to
+        pass to _end_lo_conversion(), or None if no listener is available.
+        """
+        while True:
+            if not self._start_lo_listener():
+                return None
+            with self._lo_cond:
+                while self._lo_recycle_reason is not None:
+                    self._lo_cond.wait()
+                if self._lo_proc is not None and self._lo_proc.poll() is None:
+                    self._lo_in_flight += 1
+                    return self._lo_generation
+
+    def _end_lo_conversion(self, generation: int, error: Optional[str] = None):
+        """Finish an unoconvert call started with _begin_lo_conversion().
+        
+        A failure (error) or reaching the restart threshold schedules a
+        recycle, which runs once no other calls are in flight so they aren't
+        killed mid-conversion. Failures on a listener that has already been
+        replaced are ignored.
+        """
+        with self._lo_cond:
+            self._lo_in_flight -= 1
+            if generation == self._lo_generation and self._lo_recycle_reason is None:
+                if error is not None:
+                    self._lo_recycle_reason = error
+                else:
+                    self._lo_conversions_since_restart += 1
+                    if self._lo_conversions_since_restart >= self._lo_restart_threshold:
+                        self._lo_recycle_reason = f"{self._lo_conversions_since_restart} conversions"
+            if self._lo_recycle_reason is None or self._lo_in_flight:
+                return
+            reason = self._lo_recycle_reason
+        try:
+            self._restart_lo_listener(reason)
+        finally:
+            with self._lo_cond:
+                self._lo_recycle_reason = None
+                self._lo_cond.notify_all()
+
+    def _restart_lo_listener(self, reason: str):
+        """Recycle the listener with a fresh profile; the next conversion relaunches it"""
+        print(f"  [LibreOffice] Restarting listener ({reason})")
+        self._stop_lo_listener()
+        self.log_conversion('', 'libreoffice_restart', True, error=reason)
     
+    def _load_conversion_cache(self):
+        """Load the conversion cache from the output directory"""
+        self._cache_dirty = False
+        self._cache = {}        # content key -> [filtered PDF path, mtime_ns, size]
+        self._stat_index = {}   # input path -> [mtime_ns, size, content key]
+        self._converted = {}    # converted PDF path -> [content key, mtime_ns, size] of its input and itself
+        try:
+            with open(self._cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self._cache = data.get('outputs', {})
+            self._stat_index = data.get('inputs', {})
+            self._converted = data.get('converted', {})
+        except (OSError, ValueError, AttributeError):
+            pass
+
+    def save_conversion_cache(self):
+        """Write the conversion cache atomically if it changed since the last save"""
+        with self._cache_lock:
+            if not self._cache_dirty:
+                return
+            tmp_path = f"{self._cache_path}.tmp"
+            try:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'inputs': self._stat_index, 'outputs': self._cache,
+                               'converted': self._converted}, f)
+                os.replace(tmp_path, self._cache_path)
+                self._cache_dirty = False
+            except OSError as e:
+                print(f"  [WARNING] Could not save conversion cache: {e}")
+
+    def _content_key(self, input_path: str) -> str:
+        """Return sha256+size for a file, skipping the hash when mtime and size are unchanged"""
+        input_path = os.path.abspath(input_path)
+        st = os.stat(input_path)
+        with self._cache_lock:
+            entry = self._stat_index.get(input_path)
+        if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            return entry[2]
+        
+        with open(input_path, 'rb') as f:
+            if hasattr(hashlib, 'file_digest'):
+                digest = hashlib.file_digest(f, 'sha256')
+            else:
+                digest = hashlib.sha256()
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(chunk)
+        key = f"{digest.hexdigest()}:{st.st_size}"
+        with self._cache_lock:
+            self._stat_index[input_path] = [st.st_mtime_ns, st.st_size, key]
+            self._cache_dirty = True
+        return key
+
+    def get_cached_conversion(self, input_path: str) -> Optional[str]:
+        """Return a previously converted PDF for unchanged input content.
+        
+        The PDF must still have the mtime and size it had when cached; output
+        names are shared, so a later conversion of another document with the
+        same base name may have replaced it.
+        """
+        try:
+            key = self._content_key(input_path)
+        except OSError:
+            return None
+        with self._cache_lock:
+            entry = self._cache.get(key)
+        if not isinstance(entry, list) or len(entry) != 3:
+            return None
+        pdf_path, mtime_ns, size = entry
+        try:
+            st = os.stat(pdf_path)
+        except OSError:
+            return None
+        if st.st_mtime_ns == mtime_ns and st.st_size == size:
+            return pdf_path
+        return None
+
+    def store_cached_conversion(self, input_path: str, pdf_path: str):
+        """Record a successful conversion; persisted by save_conversion_cache()"""
+        try:
+            key = self._content_key(input_path)
+            st = os.stat(pdf_path)
+        except OSError:
+            return
+        with self._cache_lock:
+            self._cache[key] = [os.path.abspath(pdf_path), st.st_mtime_ns, st.st_size]
+            self._cache_dirty = True
+
+    def record_converted_output(self, input_path: str, pdf_path: str):
+        """Remember which input content produced pdf_path, for _existing_output()"""
+        try:
+            key = self._content_key(input_path)
+            st = os.stat(pdf_path)
+        except OSError:
+            return
+        with self._cache_lock:
+            self._converted[os.path.abspath(pdf_path)] = [key, st.st_mtime_ns, st.st_size]
+            self._cache_dirty = True
+
+    def _existing_output(self, input_path: str, output_dir: str) -> Optional[str]:
+        """Return the unfiltered PDF this converter previously made from input_path's content.
+        
+        The output directory is shared between runs and projects, so a PDF with
+        the expected name is only reused when it was recorded as converted from
+        the same content and hasn't been rewritten since.
+        """
+        base_name = os.path.splitext(os.path.basename(input_path))[0]
+        expected = os.path.abspath(os.path.join(output_dir, f"{base_name}.pdf"))
+        with self._cache_lock:
+            entry = self._converted.get(expected)
+        if not entry:
+            return None
+        try:
+            st = os.stat(expected)
+            key = self._content_key(input_path)
+        except OSError:
+            return None
+        if entry == [key, st.st_mtime_ns, st.st_size]:
+            return expected
+        return None
+
     def convert_with_officetopdf(self, input_path: str, output_dir: str) -> Optional[str]:
         """Convert document using OfficeToPDF (fastest and most reliable method)"""
         if not self.officetopdf_available:
@@ -113,12 +579,12 @@ class DocumentPDFConverter:
             input_path = os.path.abspath(input_path)
             output_path = os.path.abspath(output_path)
             
-            # Run OfficeToPDF command
-            result = subprocess.run([
+            # Run OfficeToPDF command on the Word thread; it automates Word itself
+            result = self._get_word_executor().submit(subprocess.run, [
                 self.officetopdf_path,
                 input_path,
                 output_path
-            ], capture_output=True, text=True, timeout=self.config.conversion_timeout)
+            ], capture_output=True, text=True, timeout=self.config.conversion_timeout).result()
             
             if result.returncode == 0 and os.path.exists(output_path):
                 self.log_conversion(filename, 'officetopdf', True, output_path)
@@ -137,65 +603,161 @@ class DocumentPDFConverter:
             return None
     
     def convert_with_libreoffice(self, input_path: str, output_dir: str) -> Optional[str]:
-        """Convert document using LibreOffice headless mode"""
+        """Convert document using LibreOffice headless mode.
+        
+        Conversions are dispatched to a persistent listener via unoconvert when
+        available, so LibreOffice start-up is paid once per batch rather than per
+        file. Otherwise falls back to a one-shot soffice --convert-to call.
+        """
         try:
             filename = os.path.basename(input_path)
-            print(f"  [LibreOffice] Converting {filename}...")
+            base_name = os.path.splitext(filename)[0]
+            output_path = os.path.join(output_dir, f"{base_name}.pdf")
             
-            self._kill_soffice_processes() # Kill any existing soffice processes
-            import time
-            time.sleep(1) # Add a small delay
-
-            # Try different LibreOffice commands
-            commands = ['soffice', 'libreoffice', 'libreoffice.exe', 'soffice.exe']
+            print(f"  [LibreOffice] Converting {filename}...")
             
-            for cmd in commands:
-                if shutil.which(cmd):
+            generation = self._begin_lo_conversion()
+            if generation is not None:
+                error = f"unoconvert error on {filename}"
+                try:
                     result = subprocess.run([
-                        cmd, '--headless', '--convert-to', 'pdf',
-                        '--outdir', output_dir, input_path
-                    ], capture_output=True, text=True, timeout=60)
-                    
-                    if result.returncode == 0:
-                        # Determine output file path
-                        base_name = os.path.splitext(filename)[0]
-                        output_path = os.path.join(output_dir, f"{base_name}.pdf")
-                        
-                        if os.path.exists(output_path):
-                            self.log_conversion(filename, 'libreoffice', True, output_path)
-                            return output_path
+                        self._unoconvert_cmd, '--host', LO_LISTENER_HOST, '--port', str(self._lo_port),
+                        '--convert-to', 'pdf', input_path, output_path
+                    ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, errors='replace', timeout=60)
+                    if result.returncode == 0 and os.path.exists(output_path):
+                        error = None
                     else:
-                        error_msg = f"LibreOffice conversion failed: {result.stderr.strip()}"
-                        self.log_conversion(filename, 'libreoffice', False, error=error_msg)
-                        return None
-                    
-                    break
+                        print(f"  [WARNING] unoconvert failed, falling back to one-shot soffice: {result.stderr.strip()}")
+                except subprocess.TimeoutExpired:
+                    # A hung listener would stall every following conversion
+                    error = f"timeout on {filename}"
+                    raise
+                finally:
+                    self._end_lo_conversion(generation, error)
+                
+                if error is None:
+                    self.log_conversion(filename, 'libreoffice', True, output_path)
+                    return output_path
+            
+            cmd = self._find_libreoffice()
+            if cmd:
+                result = subprocess.run([
+                    cmd, f'-env:UserInstallation={self._thread_lo_profile()}',
+                    '--headless', '--convert-to', 'pdf',
+                    '--outdir', output_dir, input_path
+                ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, errors='replace', timeout=60)
+                
+                if result.returncode == 0:
+                    if os.path.exists(output_path):
+                        self.log_conversion(filename, 'libreoffice', True, output_path)
+                        return output_path
+                else:
+                    error_msg = f"LibreOffice conversion failed: {result.stderr.strip()}"
+                    self.log_conversion(filename, 'libreoffice', False, error=error_msg)
+                    self._discard_thread_lo_profile()
+                    return None
             
             self.log_conversion(filename, 'libreoffice', False, error="LibreOffice command not found or conversion failed")
             return None
             
         except subprocess.TimeoutExpired:
             self.log_conversion(filename, 'libreoffice', False, error="Conversion timeout")
+            self._discard_thread_lo_profile()
             return None
         except Exception as e:
             self.log_conversion(filename, 'libreoffice', False, error=str(e))
             return None
 
+    def convert_batch_with_libreoffice(self, inputs: List[str], output_dir: str) -> Dict[str, str]:
+        """Convert several documents in a single soffice invocation.
+        
+        Returns a mapping of input path -> PDF path for the documents that were
+        converted; callers should convert anything missing individually.
+        """
+        cmd = self._find_libreoffice()
+        if not cmd or not inputs:
+            return {}
+        
+        print(f"  [LibreOffice] Batch converting {len(inputs)} documents...")
+        started = time.time()
+        try:
+            result = subprocess.run([
+                cmd, f'-env:UserInstallation={self._thread_lo_profile()}',
+                '--headless', '--convert-to', 'pdf',
+                '--outdir', output_dir, *inputs
+            ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, errors='replace', timeout=60 * len(inputs))
+        except subprocess.TimeoutExpired:
+            print(f"  [WARNING] LibreOffice batch timed out, converting individually")
+            self._discard_thread_lo_profile()
+            self._log_batch_failure(inputs, "Batch conversion timeout")
+            return {}
+        except Exception as e:
+            print(f"  [WARNING] LibreOffice batch failed, converting individually: {e}")
+            self._log_batch_failure(inputs, str(e))
+            return {}
+        
+        if result.returncode != 0:
+            print(f"  [WARNING] LibreOffice batch failed, converting individually: {result.stderr.strip()}")
+            self._discard_thread_lo_profile()
+            self._log_batch_failure(inputs, f"Batch exited with code {result.returncode}: {result.stderr.strip()}")
+            return {}
+        
+        converted = {}
+        missing = []
+        for input_path in inputs:
+            filename = os.path.basename(input_path)
+            output_path = os.path.join(output_dir, f"{os.path.splitext(filename)[0]}.pdf")
+            # Ignore PDFs left over from an earlier run
+            if os.path.exists(output_path) and os.path.getmtime(output_path) >= started - 1:
+                self.log_conversion(filename, 'libreoffice_batch', True, output_path)
+                converted[input_path] = output_path
+            else:
+                missing.append(input_path)
+        self._log_batch_failure(missing, "Output file not created by batch")
+        return converted
+
+    def _log_batch_failure(self, inputs: List[str], error: str):
+        """Record a failed batch attempt for each input (they are retried individually)"""
+        for input_path in inputs:
+            self.log_conversion(os.path.basename(input_path), 'libreoffice_batch', False, error=error)
+
     def convert_image_to_pdf(self, input_path: str, output_dir: str) -> Optional[str]:
         """Convert an image file (e.g., JPG) to PDF."""
         try:
             filename = os.path.basename(input_path)
             base_name = os.path.splitext(filename)[0]
             output_path = os.path.join(output_dir, f"{base_name}.pdf")
+            # Written to a temporary name and moved into place once complete
+            tmp_path = f"{output_path}.tmp"
 
             print(f"  [Image] Converting {filename} to PDF...")
 
-            image = Image.open(input_path)
-            # Convert to RGB if not already, as Pillow's save method for PDF requires it
-            if image.mode in ('RGBA', 'P'):
-                image = image.convert('RGB')
-            # Save with configurable quality settings
-            image.save(output_path, "PDF", resolution=float(self.config.pdf_resolution), quality=self.config.image_quality)
+            with Image.open(input_path) as image:
+                resolution = float(self.config.pdf_resolution)
+                longest_side = max(image.size)
+                
+                if IMG2PDF_AVAILABLE and image.format == 'JPEG' and longest_side <= MAX_IMAGE_DIMENSION:
+                    # Embed the original JPEG stream as-is: no decode/re-encode pass
+                    # and no second round of lossy compression
+                    layout = img2pdf.get_fixed_dpi_layout_fun((resolution, resolution))
+                    with open(tmp_path, 'wb') as f:
+                        f.write(img2pdf.convert(input_path, layout_fun=layout))
+                    os.replace(tmp_path, output_path)
+                    self.log_conversion(filename, 'image_to_pdf', True, output_path)
+                    return output_path
+                
+                # Downscale oversized photos; scale the resolution with them so the
+                # page keeps its physical size
+                if longest_side > MAX_IMAGE_DIMENSION:
+                    image.thumbnail((MAX_IMAGE_DIMENSION, MAX_IMAGE_DIMENSION), Image.LANCZOS)
+                    resolution *= max(image.size) / longest_side
+                # Convert to RGB if not already, as Pillow's save method for PDF requires it
+                if image.mode in ('RGBA', 'P'):
+                    image = image.convert('RGB')
+                # Save with configurable quality settings
+                image.save(tmp_path, "PDF", resolution=resolution,
+                           quality=self.config.image_quality, optimize=True)
+            os.replace(tmp_path, output_path)
 
             if os.path.exists(output_path):
                 self.log_conversion(filename, 'image_to_pdf', True, output_path)
@@ -204,6 +766,8 @@ class DocumentPDFConverter:
                 self.log_conversion(filename, 'image_to_pdf', False, error="Output PDF not created from image")
                 return None
         except Exception as e:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
             self.log_conversion(filename, 'image_to_pdf', False, error=str(e))
             return None
     
@@ -214,15 +778,15 @@ class DocumentPDFConverter:
             base_name = os.path.splitext(filename)[0]
             output_path = os.path.join(output_dir, f"{base_name}.pdf")
             
+            if not self._unoconv_cmd:
+                self.log_conversion(filename, 'unoconv', False, error="unoconv command not found")
+                return None
+            
             print(f"  [unoconv] Converting {filename}...")
             
-            self._kill_soffice_processes() # Kill any existing soffice processes
-            import time
-            time.sleep(1) # Add a small delay
-
             result = subprocess.run([
-                'unoconv', '-f', 'pdf', '-o', output_path, input_path
-            ], capture_output=True, text=True, timeout=60)
+                self._unoconv_cmd, '-f', 'pdf', '-o', output_path, input_path
+            ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, errors='replace', timeout=60)
             
             if result.returncode == 0:
                 if os.path.exists(output_path):
@@ -232,7 +796,7 @@ class DocumentPDFConverter:
                     self.log_conversion(filename, 'unoconv', False, error="Output file not created")
                     return None
             else:
-                error_msg = f"unoconv conversion failed: Return code {result.returncode}. Stderr: {result.stderr.strip()}, Stdout: {result.stdout.strip()}"
+                error_msg = f"unoconv conversion failed: Return code {result.returncode}. Stderr: {result.stderr.strip()}"
                 self.log_conversion(filename, 'unoconv', False, error=error_msg)
                 return None
                 
@@ -252,8 +816,14 @@ class DocumentPDFConverter:
             
             print(f"  [docx2pdf] Converting {filename}...")
             
-            # docx2pdf requires the output path
-            docx2pdf_convert(input_path, output_path)
+            docx2pdf_convert = _load_docx2pdf()
+            if docx2pdf_convert is None:
+                self.log_conversion(filename, 'docx2pdf', False, error="docx2pdf not installed")
+                return None
+            
+            # docx2pdf requires the output path; it dispatches Word, so it runs
+            # on the Word thread like the COM conversions
+            self._get_word_executor().submit(docx2pdf_convert, input_path, output_path).result()
             
             if os.path.exists(output_path):
                 self.log_conversion(filename, 'docx2pdf', True, output_path)
@@ -266,17 +836,108 @@ class DocumentPDFConverter:
             self.log_conversion(filename, 'docx2pdf', False, error=str(e))
             return None
 
+    def _get_word_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Return the single thread that owns the Word COM instance.
+        
+        COM objects belong to the apartment that created them, and Word only
+        handles one automation call at a time, so all Word work (Word COM,
+        docx2pdf and OfficeToPDF, which both drive Word too) is funnelled
+        through one thread with COM initialised for its lifetime.
+        """
+        with self._lo_lock:
+            if self._word_executor is None:
+                com = _load_word_com()
+                self._word_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix='word-com',
+                    initializer=com[1].CoInitialize if com else None)
+            return self._word_executor
+
+    def _get_word(self):
+        """Return the cached hidden Word instance, starting it on first use (Word thread only)"""
+        if self._word is None:
+            # DispatchEx starts a private instance, so quitting it never closes
+            # documents the user has open in their own Word session
+            self._word = _load_word_com()[0].DispatchEx("Word.Application")
+            self._word.Visible = False  # Keep Word hidden
+            self._word.DisplayAlerts = 0  # wdAlertsNone
+        return self._word
+
+    def _quit_word(self):
+        """Quit the cached Word instance if one is running (Word thread only)"""
+        word, self._word = self._word, None
+        if word is not None:
+            try:
+                word.Quit()
+            except Exception:
+                pass
+
+    def _close_word(self):
+        """Quit Word and stop its thread"""
+        with self._lo_lock:
+            executor, self._word_executor = self._word_executor, None
+        if executor is not None:
+            executor.submit(self._quit_word).result()
+            com = _load_word_com()
+            if com:
+                executor.submit(com[1].CoUninitialize).result()
+            executor.shutdown()
+
+    def _word_com_export(self, input_path: str, output_path: str):
+        """Export one document to PDF with the cached Word instance (Word thread only)"""
+        word = self._get_word()
+        try:
+            # Open document
+            doc = word.Documents.Open(input_path, ReadOnly=True)
+        except Exception:
+            # Word may have died or hung up; start a fresh instance next time
+            self._quit_word()
+            raise
+        
+        try:
+            # Export as PDF with backward-compatible quality settings
+            # wdExportFormatPDF = 17
+            try:
+                # Try with all quality parameters (newer Word versions)
+                doc.ExportAsFixedFormat(
+                    OutputFileName=output_path,
+                    ExportFormat=17,  # PDF format
+                    OpenAfterExport=False,
+                    OptimizeFor=1,  # wdExportOptimizeForPrint = 1 (for quality)
+                    BitmapMissingFonts=True,
+                    UseDocumentImageResolution=True,  # Preserve original image resolution
+                    JPEGQuality=self.config.jpeg_quality,  # Configurable JPEG quality (0-100)
+                    DocStructureTags=False,
+                    CreateBookmarks=False,
+                    IncludeMarkup=False  # Exclude comments/revisions for cleaner output
+                )
+            except TypeError as te:
+                # Fallback for older Word versions - remove unsupported parameters
+                print(f"  [INFO] Using fallback Word COM parameters (older version detected)")
+                doc.ExportAsFixedFormat(
+                    OutputFileName=output_path,
+                    ExportFormat=17,  # PDF format
+                    OpenAfterExport=False,
+                    OptimizeFor=1,  # wdExportOptimizeForPrint = 1 (for quality)
+                    BitmapMissingFonts=True,
+                    DocStructureTags=False,
+                    CreateBookmarks=False
+                )
+        finally:
+            # Close document; Word itself stays running for the next file
+            doc.Close(SaveChanges=False)
+
     def convert_with_word_com(self, input_path: str, output_dir: str) -> Optional[str]:
-        """Convert document using Microsoft Word COM automation"""
-        if not WORD_AVAILABLE:
+        """Convert document using Microsoft Word COM automation.
+        
+        One hidden Word instance is reused across conversions and quit at the
+        end of convert_all_documents (or on close()).
+        """
+        if not _word_available():
             print(f"  [SKIP] Word COM not available (pywin32 not installed)")
             return None
-            
+        
+        filename = os.path.basename(input_path)
         try:
-            # Initialize COM for this thread
-            pythoncom.CoInitialize()
-            
-            filename = os.path.basename(input_path)
             base_name = os.path.splitext(filename)[0]
             output_path = os.path.join(output_dir, f"{base_name}.pdf")
             
@@ -286,49 +947,7 @@ class DocumentPDFConverter:
             input_path = os.path.abspath(input_path)
             output_path = os.path.abspath(output_path)
             
-            # Create Word application
-            word = win32com.client.Dispatch("Word.Application")
-            word.Visible = False  # Keep Word hidden
-            
-            try:
-                # Open document
-                doc = word.Documents.Open(input_path, ReadOnly=True)
-                
-                # Export as PDF with backward-compatible quality settings
-                # wdExportFormatPDF = 17
-                try:
-                    # Try with all quality parameters (newer Word versions)
-                    doc.ExportAsFixedFormat(
-                        OutputFileName=output_path,
-                        ExportFormat=17,  # PDF format
-                        OpenAfterExport=False,
-                        OptimizeFor=1,  # wdExportOptimizeForPrint = 1 (for quality)
-                        BitmapMissingFonts=True,
-                        UseDocumentImageResolution=True,  # Preserve original image resolution
-                        JPEGQuality=self.config.jpeg_quality,  # Configurable JPEG quality (0-100)
-                        DocStructureTags=False,
-                        CreateBookmarks=False,
-                        IncludeMarkup=False  # Exclude comments/revisions for cleaner output
-                    )
-                except TypeError as te:
-                    # Fallback for older Word versions - remove unsupported parameters
-                    print(f"  [INFO] Using fallback Word COM parameters (older version detected)")
-                    doc.ExportAsFixedFormat(
-                        OutputFileName=output_path,
-                        ExportFormat=17,  # PDF format
-                        OpenAfterExport=False,
-                        OptimizeFor=1,  # wdExportOptimizeForPrint = 1 (for quality)
-                        BitmapMissingFonts=True,
-                        DocStructureTags=False,
-                        CreateBookmarks=False
-                    )
-                
-                # Close document
-                doc.Close()
-                
-            finally:
-                # Always quit Word
-                word.Quit()
+            self._get_word_executor().submit(self._word_com_export, input_path, output_path).result()
             
             if os.path.exists(output_path):
                 self.log_conversion(filename, 'word_com', True, output_path)
@@ -338,18 +957,22 @@ class DocumentPDFConverter:
                 return None
                 
         except Exception as e:
-            # Make sure to quit Word if something went wrong
-            try:
-                word.Quit()
-            except:
-                pass
             error_msg = f"Word COM failed: {str(e)} | File: {filename}"
             print(f"  [ERROR] {error_msg}")
             self.log_conversion(filename, 'word_com', False, error=error_msg)
             return None
-        finally:
-            # Uninitialize COM for this thread
-            pythoncom.CoUninitialize()
+
+    def close(self):
+        """Release long-lived helpers and flush the conversion cache"""
+        self.save_conversion_cache()
+        self._close_word()
+        self._stop_lo_listener()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
     
     def convert_document_to_pdf(self, input_path: str) -> Optional[str]:
         """Convert a single document to PDF using the best available method"""
@@ -366,9 +989,10 @@ class DocumentPDFConverter:
                     return pdf_path
             
             # For .docx files, try docx2pdf second
-            pdf_path = self.convert_with_docx2pdf(input_path, self.output_dir)
-            if pdf_path:
-                return pdf_path
+            if self._docx2pdf_supported:
+                pdf_path = self.convert_with_docx2pdf(input_path, self.output_dir)
+                if pdf_path:
+                    return pdf_path
             
             # Try Word COM as fallback for .docx (Windows only)
             if self.word_available:
@@ -420,80 +1044,369 @@ class DocumentPDFConverter:
         print(f"  [FAILED] Could not convert {filename}")
         return None
     
-    def has_dollar_sign(self, pdf_path: str) -> List[int]:
-        """Check which pages contain dollar signs and return page numbers"""
+    @classmethod
+    def _raw_price_check(cls, page) -> Optional[bool]:
+        """Cheap raw content-stream check run before text extraction.
+        
+        Only decisive when every font is a simple font with an ASCII-compatible
+        encoding and no ToUnicode map and there are no form XObjects or hex
+        strings, so '$' and digits appear in the stream as their ASCII bytes:
+        False when there is no '$' at all, True when '$' is directly followed by
+        a digit (and no inline image could fake the match). Returns None
+        whenever extract_text() is needed, e.g. for subset/CID fonts.
+        """
         try:
-            reader = PdfReader(pdf_path)
-            pages_with_dollar = []
+            resources = page.get('/Resources')
+            resources = resources.get_object() if resources is not None else {}
+            fonts = resources.get('/Font')
+            fonts = fonts.get_object() if fonts is not None else {}
+            xobjects = resources.get('/XObject')
+            xobjects = xobjects.get_object() if xobjects is not None else {}
             
-            for page_num, page in enumerate(reader.pages):
-                try:
-                    text = page.extract_text()
-                    # Only flag pages that contain pricing information
-                    # Look for $ followed by numbers (actual prices)
-                    import re
-                    price_pattern = r'\$\s*[\d,]+\.?\d*'
-                    if re.search(price_pattern, text):
-                        pages_with_dollar.append(page_num)
-                        print(f"    Found pricing on page {page_num + 1}")
-                except Exception:
-                    # If we can't extract text, assume page is OK
-                    continue
-            
-            return pages_with_dollar
+            for xobject in xobjects.values():
+                if xobject.get_object().get('/Subtype') == '/Form':
+                    return None
+            if not fonts:
+                return False  # No text on the page at all
+            for font in fonts.values():
+                font = font.get_object()
+                if (font.get('/Subtype') not in ('/Type1', '/TrueType')
+                        or '/ToUnicode' in font
+                        or font.get('/Encoding') not in cls._ASCII_ENCODINGS):
+                    return None
+            
+            content = page.get_contents()
+            data = content.get_data() if content is not None else b''
+            if b'<' in data:
+                return None
+            if b'$' not in data and not cls._DOLLAR_ESCAPE_RE.search(data):
+                return False
+            if not cls._INLINE_IMAGE_RE.search(data) and cls._RAW_PRICE_RE.search(data):
+                return True
+            return None
+        except Exception:
+            return None
+
+    @classmethod
+    def _page_has_price(cls, page, page_num: int) -> bool:
+        """Check whether a single page contains pricing information"""
+        found = cls._raw_price_check(page)
+        if found is None:
+            try:
+                found = bool(cls._PRICE_RE.search(page.extract_text() or ''))
+            except Exception:
+                # If we can't extract text, assume page is OK
+                found = False
+        if found:
+            print(f"    Found pricing on page {page_num + 1}")
+        return found
+
+    def _get_filter_pool(self, max_jobs: int) -> concurrent.futures.ProcessPoolExecutor:
+        """Return the shared process pool for pricing scans, starting it on first use.
+        
+        Args:
+            max_jobs: Most jobs the caller will run at once; caps the pool size
+        
+        Workers are started with forkserver (spawn where unavailable) rather
+        than fork, since forking while conversion threads hold locks can
+        deadlock the children.
+        """
+        with self._lo_lock:
+            if self._filter_pool is None:
+                methods = multiprocessing.get_all_start_methods()
+                context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+                self._filter_pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=max(1, min(os.cpu_count() or 1, max_jobs)), mp_context=context)
+            return self._filter_pool
+
+    def _shutdown_filter_pool(self):
+        """Shut down the pricing-scan process pool if one was started"""
+        with self._lo_lock:
+            pool, self._filter_pool = self._filter_pool, None
+        if pool is not None:
+            pool.shutdown()
+
+    def _find_price_pages(self, pdf_bytes: Optional[bytes], reader: PdfReader) -> List[int]:
+        """Return indices of pages with pricing, scanning long PDFs in parallel.
+        
+        pdf_bytes are shipped to the workers; without them the scan is serial.
+        """
+        total_pages = len(reader.pages)
+        workers = os.cpu_count() or 1
+        if pdf_bytes is not None and total_pages >= PARALLEL_FILTER_MIN_PAGES and workers > 1:
+            # Contiguous page ranges so each worker parses the PDF only once
+            step = -(-total_pages // workers)
+            starts = list(range(0, total_pages, step))
+            ends = [min(start + step, total_pages) for start in starts]
+            try:
+                pool = self._get_filter_pool(len(starts))
+                price_pages = []
+                for pages in pool.map(_price_pages_in_range, [pdf_bytes] * len(starts), starts, ends):
+                    price_pages.extend(pages)
+                return price_pages
+            except Exception as e:
+                print(f"  [WARNING] Parallel pricing scan failed, scanning serially: {e}")
+        
+        return self._scan_price_pages(reader)
+
+    @classmethod
+    def _scan_price_pages(cls, reader: PdfReader) -> List[int]:
+        """Return indices of pages with pricing, scanning serially"""
+        return [page_num for page_num, page in enumerate(reader.pages)
+                if cls._page_has_price(page, page_num)]
+
+    @staticmethod
+    def _open_pdf(pdf_path: str) -> Tuple[Optional[bytes], PdfReader]:
+        """Open a PDF for reading, returning (bytes or None, reader).
+        
+        Files up to MAX_IN_MEMORY_PDF_SIZE are read with one bulk read and parsed
+        from memory, sparing pypdf's many small seeks/reads on slow or networked
+        storage. Larger files are parsed from disk and their bytes not returned.
+        """
+        if os.path.getsize(pdf_path) > MAX_IN_MEMORY_PDF_SIZE:
+            return None, PdfReader(pdf_path)
+        with open(pdf_path, 'rb') as f:
+            pdf_bytes = f.read()
+        return pdf_bytes, PdfReader(io.BytesIO(pdf_bytes))
+
+    def has_dollar_sign(self, pdf_path: str, reader: Optional[PdfReader] = None) -> List[int]:
+        """Check which pages contain dollar signs and return page numbers.
+        
+        Pass an already-open reader to avoid parsing the PDF again.
+        """
+        try:
+            if reader is None:
+                pdf_bytes, reader = self._open_pdf(pdf_path)
+            else:
+                stream = getattr(reader, 'stream', None)
+                pdf_bytes = stream.getvalue() if isinstance(stream, io.BytesIO) else None
+            return self._find_price_pages(pdf_bytes, reader)
         except Exception as e:
             print(f"  [WARNING] Could not check for dollar signs in {pdf_path}: {e}")
             return []
     
+    @staticmethod
+    def _qpdf_select_pages(pdf_path: str, page_numbers: List[int], output_path: str) -> bool:
+        """Copy the given pages (0-based, ascending) to output_path with qpdf.
+        
+        qpdf copies only the objects the kept pages reference, streaming them
+        rather than building the document in memory. Returns False when qpdf
+        is unavailable or fails, so the caller can fall back to pypdf.
+        """
+        if not QPDF_CMD:
+            return False
+        
+        # Collapse to qpdf's 1-based page ranges, e.g. "1-3,5,7-9"
+        ranges = []
+        start = prev = page_numbers[0]
+        for page_num in page_numbers[1:] + [None]:
+            if page_num is not None and page_num == prev + 1:
+                prev = page_num
+                continue
+            ranges.append(f"{start + 1}-{prev + 1}" if prev > start else f"{start + 1}")
+            if page_num is not None:
+                start = prev = page_num
+        
+        try:
+            result = subprocess.run([
+                QPDF_CMD, '--empty', '--pages', pdf_path, ','.join(ranges), '--', output_path
+            ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, errors='replace', timeout=120)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            print(f"  [WARNING] qpdf failed, using pypdf: {e}")
+            return False
+        # Exit code 3 means success with warnings
+        if result.returncode in (0, 3) and os.path.exists(output_path):
+            return True
+        print(f"  [WARNING] qpdf failed, using pypdf: {result.stderr.strip()}")
+        return False
+
     def filter_pages_with_dollar(self, pdf_path: str) -> Optional[str]:
-        """Remove pages containing dollar signs from PDF"""
+        """Remove pages containing dollar signs from PDF.
+        
+        The PDF is read once; long documents are scanned across processes and
+        the kept pages copied from the same reader. Returns the original path
+        if filtering fails.
+        """
+        return self._filter_pdf(pdf_path, self._find_price_pages) or pdf_path
+
+    @classmethod
+    def _filter_pdf(cls, pdf_path: str, find_price_pages=None) -> Optional[str]:
+        """Write pdf_path minus its pricing pages and return the path to use.
+        
+        find_price_pages(pdf_bytes, reader) defaults to a serial scan, which
+        is what process-pool workers use. Returns None if filtering fails.
+        """
         try:
-            pages_with_dollar = self.has_dollar_sign(pdf_path)
+            pdf_bytes, reader = cls._open_pdf(pdf_path)
             
-            if not pages_with_dollar:
+            if find_price_pages is None:
+                price_pages = set(cls._scan_price_pages(reader))
+            else:
+                price_pages = set(find_price_pages(pdf_bytes, reader))
+            removed = len(price_pages)
+            if not removed:
                 print(f"  [OK] No pricing pages found")
                 return pdf_path
             
-            print(f"  [FILTER] Removing {len(pages_with_dollar)} pages with pricing info")
-            
-            # Create filtered PDF
-            reader = PdfReader(pdf_path)
-            writer = PdfWriter()
+            print(f"  [FILTER] Removing {removed} pages with pricing info")
             
-            total_pages = len(reader.pages)
-            for page_num in range(total_pages):
-                if page_num not in pages_with_dollar:
-                    writer.add_page(reader.pages[page_num])
-            
-            # Save filtered PDF
+            # Save filtered PDF atomically so an interrupted write never leaves a
+            # truncated file that later runs would reuse
             filtered_path = pdf_path.replace('.pdf', '_filtered.pdf')
-            with open(filtered_path, 'wb') as output_file:
-                writer.write(output_file)
+            tmp_path = f"{filtered_path}.tmp"
+            try:
+                kept_pages = [page_num for page_num in range(len(reader.pages)) if page_num not in price_pages]
+                if not (kept_pages and cls._qpdf_select_pages(pdf_path, kept_pages, tmp_path)):
+                    writer = PdfWriter()
+                    for page_num in kept_pages:
+                        writer.add_page(reader.pages[page_num])
+                    with open(tmp_path, 'wb') as output_file:
+                        writer.write(output_file)
+                os.replace(tmp_path, filtered_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
             
             print(f"  [FILTERED] Saved to {os.path.basename(filtered_path)}")
             return filtered_path
             
         except Exception as e:
             print(f"  [WARNING] Could not filter pages: {e}")
-            return pdf_path  # Return original if filtering fails
-    
-    import concurrent.futures
+            return None
     
-    def convert_and_filter(self, filename):
+    def _prefer_libreoffice_batch(self) -> bool:
+        """Whether LibreOffice one-shot conversion is the first method for .doc/.docx.
+        
+        Batching only pays off when nothing ahead of LibreOffice in the fallback
+        chain can convert and there is no persistent listener to reuse.
+        """
+        return (self.libreoffice_available
+                and not self.officetopdf_available
+                and not self.word_available
+                and not self._docx2pdf_supported
+                and not self._unoserver_cmd)
+
+    def _convert_batch(self, filenames: List[str]) -> List[tuple]:
+        """Batch-convert documents with LibreOffice without filtering.
+        
+        Returns (filename, pdf_path, needs_filter) tuples like _convert_only;
+        documents the batch didn't produce go through _convert_only.
+        """
+        results = []
+        inputs = []
+        for filename in filenames:
+            input_path = self._resolve_input(filename)
+            if input_path is None:
+                continue
+            cached_path = self.get_cached_conversion(input_path)
+            existing = None if cached_path else self._existing_output(input_path, self.output_dir)
+            if cached_path:
+                print(f"  [CACHED] {filename} -> {os.path.basename(cached_path)}")
+                results.append((filename, cached_path, False))
+            elif existing:
+                print(f"  [EXISTING] {filename} -> {os.path.basename(existing)}")
+                results.append((filename, existing, self._needs_price_filter(filename, input_path, existing)))
+            else:
+                inputs.append(input_path)
+        done = {result[0] for result in results}
+        converted = self.convert_batch_with_libreoffice(inputs, self.output_dir)
+        
+        for filename in filenames:
+            if filename in done:
+                continue
+            input_path = os.path.join(self.docs_path, filename)
+            pdf_path = converted.get(input_path)
+            if pdf_path:
+                self.record_converted_output(input_path, pdf_path)
+                results.append((filename, pdf_path, self._needs_price_filter(filename, input_path, pdf_path)))
+            else:
+                results.append(self._convert_only(filename))
+        return results
+
+    def convert_and_filter_batch(self, filenames: List[str]) -> List[tuple]:
+        """Batch-convert documents with LibreOffice, then filter each result"""
+        results = [self._filter_converted(filename, pdf_path) if needs_filter else (filename, pdf_path)
+                   for filename, pdf_path, needs_filter in self._convert_batch(filenames)]
+        self.save_conversion_cache()
+        return results
+
+    def _resolve_input(self, filename: str) -> Optional[str]:
+        """Return the path of filename in docs_path, or None if it doesn't exist.
+        
+        During convert_all_documents, plain names are looked up in a directory
+        index built with one os.scandir; names not found there (or with
+        subdirectories) fall back to a stat.
+        """
+        index = self._docs_index
+        if index is not None and filename in index:
+            return index[filename]
+        input_path = os.path.join(self.docs_path, filename)
+        return input_path if os.path.exists(input_path) else None
+
+    @classmethod
+    def _docx_may_have_prices(cls, input_path: str) -> bool:
+        """Pre-conversion check of a .docx's XML for anything that could render as a price.
+        
+        Returns False only when no Word part contains '$' followed by a digit
+        once tags are stripped (so prices split across runs still match) and
+        the document has no embedded objects or charts, whose contents don't
+        appear in the XML text. Unreadable files return True.
+        """
+        try:
+            with zipfile.ZipFile(input_path) as docx:
+                for name in docx.namelist():
+                    if name.startswith(('word/embeddings/', 'word/charts/')):
+                        return True
+                    if name.startswith('word/') and name.endswith('.xml'):
+                        text = cls._XML_TAG_RE.sub(b'', docx.read(name))
+                        if cls._RAW_PRICE_RE.search(text):
+                            return True
+            return False
+        except Exception:
+            return True
+
+    def _needs_price_filter(self, filename: str, input_path: str, pdf_path: str) -> bool:
+        """Whether a freshly converted PDF must go through the pricing filter.
+        
+        .docx files whose XML shows no pricing skip the filter; their PDF is
+        cached directly.
+        """
+        if filename.endswith('.docx') and not self._docx_may_have_prices(input_path):
+            print(f"  [OK] {filename} - no pricing detected, skipping filter")
+            self.store_cached_conversion(input_path, pdf_path)
+            return False
+        return True
+
+    def _convert_only(self, filename) -> tuple:
+        """Conversion stage: return (filename, pdf_path, needs_filter).
+        
+        needs_filter is False for cached results and pre-made image PDFs.
+        """
         if filename.endswith(('.doc', '.docx')):
             if 'Item Summary' in filename:
                 print(f"  [SKIP] {filename} - contains pricing information")
-                return None, None
+                return None, None, False
 
-            input_path = os.path.join(self.docs_path, filename)
+            input_path = self._resolve_input(filename)
+
+            if input_path is not None:
+                cached_path = self.get_cached_conversion(input_path)
+                if cached_path:
+                    print(f"  [CACHED] {filename} -> {os.path.basename(cached_path)}")
+                    return filename, cached_path, False
+
+                # A PDF this converter already made from the same content only needs filtering
+                existing = self._existing_output(input_path, self.output_dir)
+                if existing:
+                    print(f"  [EXISTING] {filename} -> {os.path.basename(existing)}")
+                    return filename, existing, self._needs_price_filter(filename, input_path, existing)
 
-            if os.path.exists(input_path):
                 pdf_path = self.convert_document_to_pdf(input_path)
 
                 if pdf_path:
-                    filtered_pdf_path = self.filter_pages_with_dollar(pdf_path)
-                    print(f"  [SUCCESS] {filename} -> {os.path.basename(filtered_pdf_path)}")
-                    return filename, filtered_pdf_path
+                    self.record_converted_output(input_path, pdf_path)
+                    return filename, pdf_path, self._needs_price_filter(filename, input_path, pdf_path)
                 else:
                     print(f"  [FAILED] Could not convert {filename}")
             else:
@@ -502,33 +1415,154 @@ class DocumentPDFConverter:
         elif filename.endswith(('.jpg', '.jpeg', '.png')):
             # Handle JPG files that should have been converted to PDF by tag_extractor
             pdf_filename = os.path.splitext(filename)[0] + '.pdf'
-            pdf_path = os.path.join(self.docs_path, pdf_filename)
+            pdf_path = self._resolve_input(pdf_filename)
             
-            if os.path.exists(pdf_path):
+            if pdf_path is not None:
                 # Copy the PDF to our converted_pdfs directory
                 output_pdf_path = os.path.join(self.output_dir, pdf_filename)
-                shutil.copy2(pdf_path, output_pdf_path)
+                _fast_copy(pdf_path, output_pdf_path)
                 print(f"  [SUCCESS] {filename} -> {pdf_filename} (JPG->PDF)")
-                return filename, output_pdf_path
+                return filename, output_pdf_path, False
             else:
                 print(f"  [ERROR] Expected PDF not found for {filename}: {pdf_filename}")
         
-        return None, None
+        return None, None, False
+
+    def _filter_converted(self, filename: str, pdf_path: str) -> tuple:
+        """Filter stage: remove pricing pages and record the result in the cache"""
+        return self._record_filtered(filename, pdf_path, self._filter_pdf(pdf_path, self._find_price_pages))
+
+    def _record_filtered(self, filename: str, pdf_path: str, filtered_pdf_path: Optional[str]) -> tuple:
+        """Store a filtered conversion in the cache and report it.
+        
+        A failed filter (filtered_pdf_path None) falls back to the unfiltered
+        PDF, as before, but isn't cached so the next run tries again.
+        """
+        if filtered_pdf_path is None:
+            print(f"  [WARNING] {filename} - pricing filter failed, using unfiltered PDF")
+            return filename, pdf_path
+        self.store_cached_conversion(os.path.join(self.docs_path, filename), filtered_pdf_path)
+        print(f"  [SUCCESS] {filename} -> {os.path.basename(filtered_pdf_path)}")
+        return filename, filtered_pdf_path
 
-    def convert_all_documents(self, tag_mapping: Dict[str, str]) -> Dict[str, str]:
-        """Convert all documents to PDF and return filename -> PDF path mapping"""
+    def _convert_same_base(self, filenames: List[str]) -> List[tuple]:
+        """Convert and filter documents that share a base name one after another.
+        
+        Their PDFs share an output name, so each is filtered before the next
+        conversion overwrites it. Returns (filename, pdf_path, False) tuples.
+        """
+        results = []
+        for filename in filenames:
+            filename, pdf_path, needs_filter = self._convert_only(filename)
+            if needs_filter:
+                filename, pdf_path = self._filter_converted(filename, pdf_path)
+            results.append((filename, pdf_path, False))
+        return results
+
+    def convert_and_filter(self, filename):
+        filename, pdf_path, needs_filter = self._convert_only(filename)
+        if needs_filter:
+            filename, pdf_path = self._filter_converted(filename, pdf_path)
+        self.save_conversion_cache()
+        return filename, pdf_path
+
+    def convert_all_documents(self, tag_mapping: Dict[str, str], max_workers: Optional[int] = None) -> Dict[str, str]:
+        """Convert all documents to PDF and return filename -> PDF path mapping.
+        
+        Conversion and pricing filtering run as separate stages: conversions
+        (mostly waiting on subprocesses) run in threads, and each converted PDF
+        is filtered in the shared process pool so pypdf's CPU-bound text
+        extraction isn't serialised by the GIL.
+        
+        Args:
+            tag_mapping: Filename -> equipment tag mapping of documents to convert
+            max_workers: Concurrent conversions (default MAX_CONVERSION_WORKERS)
+        """
         print("="*60)
         print("CONVERTING DOCUMENTS TO HIGH-QUALITY PDF")
         print("="*60)
 
-        pdf_mapping = {}
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-            future_to_filename = {executor.submit(self.convert_and_filter, filename): filename for filename, tag in tag_mapping.items()}
-            for future in concurrent.futures.as_completed(future_to_filename):
-                filename, pdf_path = future.result()
-                if filename and pdf_path:
-                    pdf_mapping[filename] = pdf_path
+        # Documents sharing a base name (X.doc and X.docx) write the same
+        # output PDF, so they are converted one after another in one worker
+        base_groups = {}
+        for filename in tag_mapping:
+            base_groups.setdefault(os.path.splitext(filename)[0], []).append(filename)
+        
+        # Group .doc/.docx files into batches when LibreOffice would convert them
+        # one by one anyway; documents sharing a base name stay per-file
+        batched = []
+        if self._prefer_libreoffice_batch():
+            batched = [group[0] for group in base_groups.values()
+                       if len(group) == 1 and group[0].endswith(('.doc', '.docx'))
+                       and 'Item Summary' not in group[0]]
+        batched_set = set(batched)
+        
+        # One directory read instead of a stat per document
+        try:
+            with os.scandir(self.docs_path) as entries:
+                self._docs_index = {entry.name: entry.path for entry in entries if entry.is_file()}
+        except OSError:
+            self._docs_index = None
+        
+        converted = {}
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers or MAX_CONVERSION_WORKERS) as conversion_executor:
+                filter_executor = None
+                # future -> filenames it converts, so a failure can be reported per document
+                conversion_futures = {}
+                for i in range(0, len(batched), LO_BATCH_SIZE):
+                    chunk = batched[i:i + LO_BATCH_SIZE]
+                    conversion_futures[conversion_executor.submit(self._convert_batch, chunk)] = chunk
+                for group in base_groups.values():
+                    if len(group) > 1:
+                        conversion_futures[conversion_executor.submit(self._convert_same_base, group)] = group
+                    elif group[0] not in batched_set:
+                        future = conversion_executor.submit(lambda f: [self._convert_only(f)], group[0])
+                        conversion_futures[future] = group
+                
+                filter_futures = {}
+                for future in concurrent.futures.as_completed(conversion_futures):
+                    try:
+                        results = future.result()
+                    except Exception as e:
+                        # One failed conversion shouldn't abort the rest of the run
+                        for filename in conversion_futures[future]:
+                            print(f"  [ERROR] Conversion failed for {filename}: {e}")
+                            self.log_conversion(filename, 'conversion', False, error=str(e))
+                        continue
+                    for filename, pdf_path, needs_filter in results:
+                        if not filename or not pdf_path:
+                            continue
+                        if needs_filter:
+                            try:
+                                if filter_executor is None:
+                                    filter_executor = self._get_filter_pool(len(tag_mapping))
+                                filter_futures[filter_executor.submit(_filter_pdf_worker, pdf_path)] = (filename, pdf_path)
+                            except Exception as e:
+                                print(f"  [WARNING] Filter pool unavailable for {filename}, filtering in-process: {e}")
+                                converted[filename] = self._record_filtered(filename, pdf_path, self._filter_pdf(pdf_path))[1]
+                        else:
+                            converted[filename] = pdf_path
+                
+                for future in concurrent.futures.as_completed(filter_futures):
+                    filename, pdf_path = filter_futures[future]
+                    try:
+                        filename, pdf_path = self._record_filtered(filename, pdf_path, future.result())
+                    except Exception as e:
+                        # e.g. a broken process pool: filter in this process instead
+                        print(f"  [WARNING] Filter worker failed for {filename}, retrying in-process: {e}")
+                        filename, pdf_path = self._record_filtered(filename, pdf_path, self._filter_pdf(pdf_path))
+                    converted[filename] = pdf_path
+        finally:
+            self._docs_index = None
+            self.save_conversion_cache()
+            self._cleanup_thread_profiles()
+            self._shutdown_filter_pool()
+            self._close_word()
+            self._stop_lo_listener()
 
+        # Keep the tag mapping order regardless of completion order
+        pdf_mapping = {filename: converted[filename] for filename in tag_mapping if filename in converted}
         return pdf_mapping
 
     def print_conversion_summary(self):
@@ -537,12 +1571,16 @@ class DocumentPDFConverter:
         print("CONVERSION SUMMARY")
         print("="*60)
         
-        successful = [log for log in self.conversion_log if log['success']]
-        failed = [log for log in self.conversion_log if not log['success']]
+        attempts = [log for log in self.conversion_log if log['method'] != 'libreoffice_restart']
+        successful = [log for log in attempts if log['success']]
+        failed = [log for log in attempts if not log['success']]
+        restarts = len(self.conversion_log) - len(attempts)
         
-        print(f"Total conversions attempted: {len(self.conversion_log)}")
+        print(f"Total conversions attempted: {len(attempts)}")
         print(f"Successful conversions: {len(successful)}")
         print(f"Failed conversions: {len(failed)}")
+        if restarts:
+            print(f"LibreOffice listener restarts: {restarts}")
         
         # Group by method
         methods = {}
@@ -559,6 +1597,16 @@ class DocumentPDFConverter:
             for log in failed:
                 print(f"  {log['filename']}: {log['error']}")
 
+def _price_pages_in_range(pdf_bytes: bytes, start: int, end: int) -> List[int]:
+    """Process-pool worker: return pages in [start, end) that contain pricing"""
+    reader = PdfReader(io.BytesIO(pdf_bytes))
+    return [page_num for page_num in range(start, end)
+            if DocumentPDFConverter._page_has_price(reader.pages[page_num], page_num)]
+
+def _filter_pdf_worker(pdf_path: str) -> Optional[str]:
+    """Process-pool worker: filter pricing pages out of one converted PDF"""
+    return DocumentPDFConverter._filter_pdf(pdf_path)
+
 def main():
     """Main function to test the converter"""
     docs_path = r"C:\Users\jacob\Claude\python-docx\documents\CS_Air_Handler_Light_Kit"
@@ -65,6 +65,24 @@ class Config:
             300  # 5 minutes for Gotenberg conversions
         )
         
+        # Number of files sent to Gotenberg concurrently
+        self.gotenberg_max_workers = self._get_env_int(
+            'DST_GOTENBERG_MAX_WORKERS',
+            4
+        )
+        
+        # Optional PDF/A format (e.g. 'PDF/A-2b') applied once to the final submittal
+        self.pdfa_format = self._get_env_str(
+            'DST_PDFA_FORMAT',
+            ''  # Empty = no PDF/A conversion
+        )
+        
+        # Use asyncio + httpx instead of a thread pool for concurrent conversions
+        self.gotenberg_use_async = self._get_env_bool(
+            'DST_GOTENBERG_ASYNC',
+            False
+        )
+        
         # PDF Quality settings for Gotenberg
         self.pdf_resolution = self._get_env_int(
             'DST_PDF_RESOLUTION',
@@ -6,13 +6,22 @@ High-quality document conversion using Gotenberg API with built-in merging
 and quality control for technical drawings.
 """
 
+import asyncio
+import io
 import os
 import time
 import subprocess
 import requests
 import tempfile
+import threading
+import zipfile
+from collections import OrderedDict
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
-from typing import List, Dict, Optional, Union
+from typing import Callable, List, Dict, Optional, Tuple, Union
 import json
 
 # PDF bookmark support
@@ -26,15 +35,94 @@ except ImportError:
     except ImportError:
         PYPDF_AVAILABLE = False
 
+# Optional streaming multipart encoder for large uploads
+try:
+    from requests_toolbelt.multipart.encoder import MultipartEncoder
+    TOOLBELT_AVAILABLE = True
+except ImportError:
+    TOOLBELT_AVAILABLE = False
+
+# Optional faster JSON encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional async HTTP client for concurrent per-file conversions
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
 try:
     from .logger import get_logger
-    from .title_page_generator import TitlePageGenerator
+    from .title_page_generator import TitlePageGenerator, create_plain_title_page_bytes
 except ImportError:
     from logger import get_logger
-    from title_page_generator import TitlePageGenerator
+    from title_page_generator import TitlePageGenerator, create_plain_title_page_bytes
 
 logger = get_logger('gotenberg_converter')
 
+# Chunk size used when streaming Gotenberg responses to disk
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Seconds a health or Docker check result is reused
+_CHECK_TTL = 30
+
+# Maximum number of rendered title pages kept in memory
+_TITLE_CACHE_SIZE = 128
+
+# Simple title page: large bold text in the center of a letter-size page
+_TITLE_PAGE_HTML = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <meta charset="UTF-8">
+            <style>
+                @page {{
+                    size: 8.5in 11in;
+                    margin: 0;
+                }}
+                body {{
+                    font-family: 'Helvetica', Arial, sans-serif;
+                    margin: 0;
+                    padding: 0;
+                    width: 8.5in;
+                    height: 11in;
+                    -webkit-print-color-adjust: exact;
+                }}
+                .title-container {{
+                    text-align: center;
+                    width: 100%;
+                    padding-top: 4.5in;  /* Center on 11in page (approximately) */
+                }}
+                h1 {{
+                    font-size: 72px;
+                    font-weight: bold;
+                    color: #000000;
+                    margin: 0;
+                    padding: 0;
+                }}
+            </style>
+        </head>
+        <body>
+            <div class="title-container">
+                <h1>{tag}</h1>
+            </div>
+        </body>
+        </html>
+        """
+
+def _event_loop_running() -> bool:
+    """Whether the calling thread is already running an asyncio event loop"""
+    try:
+        asyncio.get_running_loop()
+        return True
+    except RuntimeError:
+        return False
+
 class GotenbergConverter:
     """
     Document converter using Gotenberg API
@@ -43,11 +131,60 @@ class GotenbergConverter:
     quality control, and support for technical drawings.
     """
     
-    def __init__(self, gotenberg_url: str = 'http://localhost:3000'):
+    # Rendered title page PDFs keyed by equipment_tag, shared by all
+    # instances since a converter is created per request
+    _title_cache: 'OrderedDict[str, bytes]' = OrderedDict()
+    _title_cache_lock = threading.Lock()
+    
+    # Recent health/Docker check results: key -> (monotonic time, result)
+    _check_cache: Dict[str, Tuple[float, bool]] = {}
+    
+    # Service URLs already confirmed healthy, dropped again on connection errors;
+    # the lock serializes startup attempts
+    _ready_services: set = set()
+    _service_lock = threading.Lock()
+    
+    def __init__(self, gotenberg_url: str = 'http://localhost:3000', max_workers: int = 4,
+                 use_async: bool = False):
         self.base_url = gotenberg_url.rstrip('/')
-        self.session = requests.Session()
         self.container_name = 'gotenberg-service'
         
+        # Number of files converted concurrently; Gotenberg handles parallel requests
+        self.max_workers = max(1, max_workers)
+        
+        # Optionally run per-file conversions on an asyncio event loop (needs httpx)
+        self.use_async = use_async and HTTPX_AVAILABLE
+        if use_async and not HTTPX_AVAILABLE:
+            logger.warning("httpx not available, using thread pool for concurrent conversions")
+        
+        # Size the connection pool to match so workers don't wait on connections,
+        # and retry requests that hit a transient gateway error from the container.
+        # Read timeouts aren't retried: a conversion that ran out its timeout
+        # would only run it out again
+        self.session = requests.Session()
+        retries = Retry(
+            total=3,
+            read=0,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=['GET', 'POST'],
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers,
+                              max_retries=retries)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+        # Streamed multipart bodies are consumed as they are sent and can't be
+        # replayed, so they go through a session that never retries
+        self.stream_session = None
+        if TOOLBELT_AVAILABLE:
+            self.stream_session = requests.Session()
+            stream_adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers,
+                                         max_retries=Retry(total=0, raise_on_status=False))
+            self.stream_session.mount('http://', stream_adapter)
+            self.stream_session.mount('https://', stream_adapter)
+        
         # Initialize ReportLab title page generator
         try:
             self.title_generator = TitlePageGenerator()
@@ -56,7 +193,7 @@ class GotenbergConverter:
         except ImportError:
             self.title_generator = None
             self.reportlab_available = False
-            logger.warning("ReportLab not available, falling back to HTML title pages")
+            logger.warning("ReportLab not available, falling back to plain title pages")
         
         # Quality presets for different use cases
         # Note: maxImageResolution must be 75, 150, 300, 600, or 1200 (Gotenberg requirement)
@@ -87,26 +224,54 @@ class GotenbergConverter:
             }
         }
         
-        # Ensure Gotenberg is running
-        self.ensure_service_running()
+        # Service info fields that never change for this instance
+        self._static_info = {
+            'url': self.base_url,
+            'container_name': self.container_name,
+            'quality_presets': list(self.quality_presets.keys()),
+            'title_page_generator': {
+                'reportlab_available': self.reportlab_available,
+                'method': 'ReportLab' if self.reportlab_available else 'Plain fallback'
+            }
+        }
+        
+        # Gotenberg availability is checked lazily on first use (see ensure_service_running)
+    
+    def _cached_check(self, key: str, check: Callable[[], bool], use_cache: bool) -> bool:
+        """Run a status check, reusing a result younger than _CHECK_TTL seconds"""
+        now = time.monotonic()
+        if use_cache:
+            cached = GotenbergConverter._check_cache.get(key)
+            if cached is not None and now - cached[0] < _CHECK_TTL:
+                return cached[1]
+        
+        result = check()
+        GotenbergConverter._check_cache[key] = (now, result)
+        return result
     
-    def check_service_health(self) -> bool:
+    def check_service_health(self, use_cache: bool = True) -> bool:
         """Check if Gotenberg service is healthy"""
-        try:
-            response = self.session.get(f'{self.base_url}/health', timeout=5)
-            return response.status_code == 200
-        except Exception as e:
-            logger.debug(f"Health check failed: {e}")
-            return False
+        def probe() -> bool:
+            try:
+                response = self.session.get(f'{self.base_url}/health', timeout=5)
+                return response.status_code == 200
+            except Exception as e:
+                logger.debug(f"Health check failed: {e}")
+                return False
+        
+        return self._cached_check(f'health:{self.base_url}', probe, use_cache)
     
-    def check_docker_running(self) -> bool:
+    def check_docker_running(self, use_cache: bool = True) -> bool:
         """Check if Docker is available"""
-        try:
-            result = subprocess.run(['docker', '--version'], 
-                                  capture_output=True, text=True, timeout=5)
-            return result.returncode == 0
-        except Exception:
-            return False
+        def probe() -> bool:
+            try:
+                result = subprocess.run(['docker', '--version'], 
+                                      capture_output=True, text=True, timeout=5)
+                return result.returncode == 0
+            except Exception:
+                return False
+        
+        return self._cached_check('docker', probe, use_cache)
     
     def start_gotenberg_container(self) -> bool:
         """Start Gotenberg Docker container"""
@@ -134,12 +299,16 @@ class GotenbergConverter:
                     'gotenberg/gotenberg:8'
                 ], check=True)
             
-            # Wait for service to be ready
-            for i in range(30):  # Wait up to 30 seconds
-                if self.check_service_health():
+            # Wait for service to be ready, polling quickly at first so a fast
+            # startup isn't held up by a full second of sleep
+            deadline = time.monotonic() + 30  # Wait up to 30 seconds
+            delay = 0.1
+            while time.monotonic() < deadline:
+                if self.check_service_health(use_cache=False):
                     logger.info("Gotenberg service is ready")
                     return True
-                time.sleep(1)
+                time.sleep(delay)
+                delay = min(delay * 2, 1.0)
             
             logger.error("Gotenberg service failed to start within 30 seconds")
             return False
@@ -152,13 +321,34 @@ class GotenbergConverter:
             return False
     
     def ensure_service_running(self) -> bool:
-        """Ensure Gotenberg service is running and healthy"""
-        if self.check_service_health():
-            logger.debug("Gotenberg service is already running")
+        """
+        Ensure Gotenberg service is running and healthy
+        
+        Once a service URL has been confirmed healthy the result is remembered
+        for all converter instances, so later calls return immediately.
+        """
+        if self.base_url in GotenbergConverter._ready_services:
             return True
         
-        logger.info("Gotenberg service not found, attempting to start...")
-        return self.start_gotenberg_container()
+        with GotenbergConverter._service_lock:
+            # Another thread may have confirmed the service while we waited
+            if self.base_url in GotenbergConverter._ready_services:
+                return True
+            
+            if self.check_service_health():
+                logger.debug("Gotenberg service is already running")
+            else:
+                logger.info("Gotenberg service not found, attempting to start...")
+                if not self.start_gotenberg_container():
+                    return False
+            
+            GotenbergConverter._ready_services.add(self.base_url)
+            return True
+    
+    def _mark_service_down(self):
+        """Forget that the service was healthy so the next call re-checks (and restarts) it"""
+        GotenbergConverter._ready_services.discard(self.base_url)
+        GotenbergConverter._check_cache.pop(f'health:{self.base_url}', None)
     
     def create_title_page_html(self, equipment_tag: str, documents: List[str] = None) -> str:
         """
@@ -172,46 +362,48 @@ class GotenbergConverter:
         Returns:
             HTML content for title page
         """
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <style>
-                @page {{
-                    size: 8.5in 11in;
-                    margin: 0;
-                }}
-                body {{
-                    font-family: 'Helvetica', Arial, sans-serif;
-                    margin: 0;
-                    padding: 0;
-                    width: 8.5in;
-                    height: 11in;
-                    -webkit-print-color-adjust: exact;
-                }}
-                .title-container {{
-                    text-align: center;
-                    width: 100%;
-                    padding-top: 4.5in;  /* Center on 11in page (approximately) */
-                }}
-                h1 {{
-                    font-size: 72px;
-                    font-weight: bold;
-                    color: #000000;
-                    margin: 0;
-                    padding: 0;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="title-container">
-                <h1>{equipment_tag.replace('CUTSHEETS', 'CUT SHEETS')}</h1>
-            </div>
-        </body>
-        </html>
+        return _TITLE_PAGE_HTML.format(tag=equipment_tag.replace('CUTSHEETS', 'CUT SHEETS'))
+    
+    def _render_title_pdf_bytes(self, equipment_tag: str) -> bytes:
         """
-        return html_content
+        Render a title page PDF locally, reusing earlier renders of the same tag
+        
+        Uses ReportLab if available, otherwise writes a plain Helvetica title
+        page directly; neither needs a Gotenberg round-trip. Results are cached
+        on the class so repeated tags across converter instances skip the
+        render entirely.
+        
+        Args:
+            equipment_tag: Equipment identifier
+        
+        Returns:
+            PDF content as bytes
+        """
+        key = equipment_tag
+        with self._title_cache_lock:
+            title_bytes = self._title_cache.get(key)
+            if title_bytes is not None:
+                self._title_cache.move_to_end(key)
+                logger.debug(f"Reusing cached title page PDF for {equipment_tag}")
+                return title_bytes
+        
+        # Use ReportLab if available, otherwise fall back to the plain page
+        if self.reportlab_available:
+            try:
+                title_bytes = self.title_generator.create_title_page_bytes(equipment_tag)
+                logger.info(f"Created ReportLab title page PDF for {equipment_tag}")
+            except Exception as e:
+                logger.warning(f"ReportLab title page failed, falling back to plain title page: {e}")
+        
+        if title_bytes is None:
+            title_bytes = create_plain_title_page_bytes(equipment_tag)
+            logger.info(f"Created plain title page PDF for {equipment_tag}")
+        
+        with self._title_cache_lock:
+            self._title_cache[key] = title_bytes
+            if len(self._title_cache) > _TITLE_CACHE_SIZE:
+                self._title_cache.popitem(last=False)
+        return title_bytes
     
     def convert_files_to_pdf(self, 
                            file_paths: List[str], 
@@ -252,51 +444,54 @@ class GotenbergConverter:
             return False
         
         try:
+            # Converted PDFs are kept in memory as (filename, pdf_bytes) until the merge
             individual_pdfs = []
             
             # Create title page PDF first
             if include_title_page and equipment_tag:
-                title_pdf = tempfile.mktemp(suffix='_title.pdf')
-                
-                # Use ReportLab if available, otherwise fall back to HTML
-                if self.reportlab_available:
-                    try:
-                        self.title_generator.create_title_page_pdf(equipment_tag, title_pdf)
-                        individual_pdfs.append(title_pdf)
-                        logger.info(f"Created ReportLab title page PDF for {equipment_tag}")
-                    except Exception as e:
-                        logger.warning(f"ReportLab title page failed, falling back to HTML: {e}")
-                        if self._convert_single_file_to_pdf(None, title_pdf, equipment_tag, quality_mode, is_title=True):
-                            individual_pdfs.append(title_pdf)
-                            logger.info(f"Created HTML title page PDF for {equipment_tag}")
-                else:
-                    # Fall back to HTML method
-                    if self._convert_single_file_to_pdf(None, title_pdf, equipment_tag, quality_mode, is_title=True):
-                        individual_pdfs.append(title_pdf)
-                        logger.info(f"Created HTML title page PDF for {equipment_tag}")
+                individual_pdfs.append(('title.pdf', self._render_title_pdf_bytes(equipment_tag)))
             
             # Convert each file individually to maintain order
             logger.info(f"Converting {len(file_paths)} files individually to maintain order:")
+            jobs = []
+            dir_entries = self._scan_parent_dirs(file_paths)
             for i, file_path in enumerate(file_paths):
-                if not os.path.exists(file_path):
-                    parent_dir = os.path.dirname(file_path)
-                    available_files = []
-                    if os.path.exists(parent_dir):
-                        available_files = os.listdir(parent_dir)[:5]
+                parent_dir, name = os.path.split(file_path)
+                entries = dir_entries[parent_dir]
+                # The stat fallback covers case-insensitive filesystems
+                if (entries is None or name not in entries) and not os.path.exists(file_path):
                     logger.warning(
                         f"File not found: {file_path}\n"
                         f"Parent directory: {parent_dir}\n"
-                        f"Parent exists: {os.path.exists(parent_dir)}\n"
-                        f"Available files: {available_files}"
+                        f"Parent exists: {entries is not None}\n"
+                        f"Available files: {sorted(entries)[:5] if entries else []}"
                     )
                     continue
                 
                 filename = os.path.basename(file_path)
                 logger.info(f"  Converting {i+1}/{len(file_paths)}: {filename}")
                 
-                temp_pdf = tempfile.mktemp(suffix=f'_{i}_{filename}.pdf')
-                if self._convert_single_file_to_pdf(file_path, temp_pdf, equipment_tag, quality_mode):
-                    individual_pdfs.append(temp_pdf)
+                jobs.append(file_path)
+            
+            # Convert the whole group in one request when possible
+            results = self._convert_batch_to_pdfs(jobs, quality_mode) if len(jobs) > 1 else None
+            
+            # asyncio.run can't be nested, e.g. when called from an async web
+            # handler; the thread pool is used under a running loop instead
+            if results is None and self.use_async and not _event_loop_running():
+                results = asyncio.run(self.async_convert_files(jobs, quality_mode))
+            elif results is None:
+                # Run conversions concurrently; map() yields results in submission order
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    results = list(executor.map(
+                        lambda path: self._convert_single_file_to_pdf(path, equipment_tag, quality_mode),
+                        jobs
+                    ))
+            
+            for file_path, pdf_bytes in zip(jobs, results):
+                filename = os.path.basename(file_path)
+                if pdf_bytes is not None:
+                    individual_pdfs.append((f'{os.path.splitext(filename)[0]}.pdf', pdf_bytes))
                 else:
                     logger.warning(f"Failed to convert {filename}")
             
@@ -304,22 +499,25 @@ class GotenbergConverter:
                 logger.error("No files were successfully converted")
                 return False
             
-            # Merge all individual PDFs in correct order
-            logger.info(f"Merging {len(individual_pdfs)} PDFs in correct order...")
-            success = self.merge_pdfs(individual_pdfs, output_path)
-            
-            # Count pages in final PDF for bookmark calculation
-            page_count = 0
-            if success and os.path.exists(output_path):
-                page_count = self._count_pdf_pages(output_path)
+            if len(individual_pdfs) == 1:
+                # Nothing to merge; write the single converted PDF as-is
+                pdf_bytes = individual_pdfs[0][1]
+                with open(output_path, 'wb') as f:
+                    f.write(pdf_bytes)
+                logger.info(f"Single PDF, skipping merge: {output_path}")
+                page_count = self._count_pdf_pages(pdf_bytes)
+                success = True
+            else:
+                # Merge all individual PDFs in correct order; the local merge also
+                # reports the page count used for bookmark calculation
+                logger.info(f"Merging {len(individual_pdfs)} PDFs in correct order...")
+                page_count = self._local_merge_pdfs(individual_pdfs, output_path) if PYPDF_AVAILABLE else 0
+                success = page_count > 0
             
-            # Cleanup individual PDFs
-            for pdf_path in individual_pdfs:
-                try:
-                    if os.path.exists(pdf_path):
-                        os.remove(pdf_path)
-                except Exception as e:
-                    logger.warning(f"Failed to cleanup temp PDF {pdf_path}: {e}")
+            if not success:
+                success = self._gotenberg_merge_pdfs(individual_pdfs, output_path)
+                if success and os.path.exists(output_path):
+                    page_count = self._count_pdf_pages(output_path)
             
             return {
                 'success': success,
@@ -331,138 +529,435 @@ class GotenbergConverter:
             logger.error(f"Conversion error: {e}")
             return False
     
-    def _convert_single_file_to_pdf(self, file_path: str, output_path: str, 
-                                   equipment_tag: str, quality_mode: str, 
-                                   is_title: bool = False) -> bool:
+    def _convert_single_file_to_pdf(self, file_path: Optional[str], equipment_tag: str,
+                                   quality_mode: str, is_title: bool = False) -> Optional[bytes]:
         """
         Convert a single file to PDF using Gotenberg
         
         Args:
             file_path: Path to file to convert (None for title page)
-            output_path: Output PDF path
             equipment_tag: Equipment tag for title page
             quality_mode: Quality preset
             is_title: Whether this is a title page conversion
         
         Returns:
-            True if successful, False otherwise
+            PDF content as bytes if successful, None otherwise
         """
         try:
-            files = []
+            with ExitStack() as stack:
+                files = []
+                
+                if is_title:
+                    # Create title page
+                    title_html = self.create_title_page_html(equipment_tag)
+                    files.append(('files', ('title.html', title_html, 'text/html')))
+                else:
+                    # Add single document file (passed as a handle, not a bytes copy)
+                    filename = os.path.basename(file_path)
+                    files.append(('files', (filename, stack.enter_context(open(file_path, 'rb')))))
+                
+                # Make conversion request
+                response = self._post_multipart(
+                    f'{self.base_url}/forms/libreoffice/convert',
+                    files,
+                    self._conversion_form_data(quality_mode),
+                    timeout=300  # 5 minutes timeout
+                )
+                
+                if response.status_code == 200:
+                    # Keep the PDF in memory; it is only written once merged
+                    return response.content
+                else:
+                    logger.error(f"Single file conversion failed: HTTP {response.status_code}")
+                    return None
+                
+        except Exception as e:
+            logger.error(f"Single file conversion error: {e}")
+            return None
+    
+    @staticmethod
+    def _scan_parent_dirs(file_paths: List[str]) -> Dict[str, Optional[set]]:
+        """
+        List each distinct parent directory once
+        
+        Returns:
+            Mapping of parent directory to the set of entry names in it,
+            or None if the directory does not exist
+        """
+        dir_entries = {}
+        for file_path in file_paths:
+            parent_dir = os.path.dirname(file_path)
+            if parent_dir in dir_entries:
+                continue
+            try:
+                with os.scandir(parent_dir or '.') as it:
+                    dir_entries[parent_dir] = {entry.name for entry in it}
+            except OSError:
+                dir_entries[parent_dir] = None
+        return dir_entries
+    
+    async def async_convert_files(self, file_paths: List[str], quality_mode: str = 'high') -> List[Optional[bytes]]:
+        """
+        Convert files to PDF concurrently on the event loop using httpx
+        
+        Args:
+            file_paths: Paths of files to convert
+            quality_mode: Quality preset
+        
+        Returns:
+            PDF bytes for each input in order (None for files that failed)
+        """
+        data = self._conversion_form_data(quality_mode)
+        limits = httpx.Limits(max_connections=self.max_workers)
+        
+        async with httpx.AsyncClient(base_url=self.base_url, limits=limits, timeout=300) as client:
+            async def convert_one(file_path: str) -> Optional[bytes]:
+                try:
+                    with open(file_path, 'rb') as f:
+                        files = [('files', (os.path.basename(file_path), f))]
+                        response = await client.post('/forms/libreoffice/convert', files=files, data=data)
+                    
+                    if response.status_code == 200:
+                        return response.content
+                    logger.error(f"Single file conversion failed: HTTP {response.status_code}")
+                    return None
+                except (httpx.ConnectError, httpx.ConnectTimeout, httpx.RemoteProtocolError) as e:
+                    self._mark_service_down()
+                    logger.error(f"Single file conversion error: {e}")
+                    return None
+                except Exception as e:
+                    logger.error(f"Single file conversion error: {e}")
+                    return None
             
-            if is_title:
-                # Create title page
-                title_html = self.create_title_page_html(equipment_tag)
-                files.append(('files', ('title.html', title_html, 'text/html')))
-            else:
-                # Add single document file
-                filename = os.path.basename(file_path)
-                with open(file_path, 'rb') as f:
-                    file_content = f.read()
-                    files.append(('files', (filename, file_content)))
+            return await asyncio.gather(*(convert_one(path) for path in file_paths))
+    
+    def _convert_batch_to_pdfs(self, file_paths: List[str], quality_mode: str) -> Optional[List[bytes]]:
+        """
+        Convert several files in a single Gotenberg request
+        
+        Without merge=true Gotenberg returns a ZIP holding one PDF per input.
+        Inputs are uploaded with ordered filename prefixes (001_, 002_, ...)
+        so the PDFs can be matched back to the input order.
+        
+        Args:
+            file_paths: Paths of files to convert
+            quality_mode: Quality preset
+        
+        Returns:
+            PDF bytes for each input in order, None if the batch failed
+            (callers fall back to per-file conversion)
+        """
+        try:
+            with ExitStack() as stack:
+                files = []
+                for i, file_path in enumerate(file_paths):
+                    ordered_filename = f"{i+1:03d}_{os.path.basename(file_path)}"
+                    files.append(('files', (ordered_filename, stack.enter_context(open(file_path, 'rb')))))
+                
+                logger.info(f"Converting {len(files)} files in one batch request...")
+                response = self._post_multipart(
+                    f'{self.base_url}/forms/libreoffice/convert',
+                    files,
+                    self._conversion_form_data(quality_mode),
+                    timeout=300 * len(files)  # 5 minutes per file
+                )
             
-            # Get quality settings
-            quality_settings = self.quality_presets.get(quality_mode, self.quality_presets['high'])
+            if response.status_code != 200:
+                logger.warning(f"Batch conversion failed: HTTP {response.status_code}, converting files individually")
+                return None
             
-            # Prepare form data - NO merge since it's a single file
-            data = {
-                'pdfa': 'PDF/A-2b',  # Archival quality
-                **quality_settings
-            }
+            with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+                # Each input's PDF is looked up by its ordered name rather than by
+                # position, so renamed or missing outputs can't shift documents
+                members = set(archive.namelist())
+                expected = [f"{i+1:03d}_{os.path.splitext(os.path.basename(file_path))[0]}.pdf"
+                            for i, file_path in enumerate(file_paths)]
+                missing = [name for name in expected if name not in members]
+                if missing:
+                    logger.warning(f"Batch conversion is missing {len(missing)} of {len(file_paths)} PDFs "
+                                   f"(e.g. {missing[0]}), converting files individually")
+                    return None
+                return [archive.read(name) for name in expected]
+                
+        except Exception as e:
+            logger.warning(f"Batch conversion error: {e}, converting files individually")
+            return None
+    
+    def _conversion_form_data(self, quality_mode: str, pdfa: Optional[str] = None) -> Dict[str, str]:
+        """
+        Build the LibreOffice conversion form fields for a quality preset
+        
+        PDF/A is off by default: it adds a normalization pass per file, and
+        intermediate PDFs lose conformance when merged anyway. Use
+        convert_to_pdfa on the final output instead.
+        """
+        # Get quality settings
+        quality_settings = self.quality_presets.get(quality_mode, self.quality_presets['high'])
+        
+        # NO merge - each file is converted to its own PDF
+        data = dict(quality_settings)
+        if pdfa:
+            data['pdfa'] = pdfa
+        return data
+    
+    def convert_to_pdfa(self, pdf_path: str, pdfa: str = 'PDF/A-2b') -> bool:
+        """
+        Convert a finished PDF to PDF/A in place using Gotenberg's PDF engines
+        
+        Args:
+            pdf_path: Path to the PDF to convert
+            pdfa: PDF/A format (e.g., "PDF/A-2b")
+        
+        Returns:
+            True if successful, False otherwise (the original file is left untouched)
+        """
+        if not self.ensure_service_running():
+            logger.error(f"Gotenberg service is not available for PDF/A conversion: {self.base_url}")
+            return False
+        
+        temp_path = None
+        try:
+            with open(pdf_path, 'rb') as pdf_file:
+                files = [('files', (os.path.basename(pdf_path), pdf_file, 'application/pdf'))]
+                with self._post_multipart(
+                    f'{self.base_url}/forms/pdfengines/convert',
+                    files,
+                    {'pdfa': pdfa},
+                    timeout=300,
+                    stream=True
+                ) as response:
+                    if response.status_code != 200:
+                        logger.error(f"PDF/A conversion failed: HTTP {response.status_code}")
+                        return False
+                    
+                    with tempfile.NamedTemporaryFile(dir=os.path.dirname(os.path.abspath(pdf_path)),
+                                                     suffix='.tmp', delete=False) as output_file:
+                        temp_path = output_file.name
+                    self._save_response(response, temp_path)
             
-            # Make conversion request
-            response = self.session.post(
-                f'{self.base_url}/forms/libreoffice/convert',
-                files=files,
-                data=data,
-                timeout=300  # 5 minutes timeout
-            )
+            os.replace(temp_path, pdf_path)
+            temp_path = None
+            logger.info(f"Converted {pdf_path} to {pdfa}")
+            return True
             
-            if response.status_code == 200:
-                # Save the PDF
-                with open(output_path, 'wb') as f:
-                    f.write(response.content)
-                return True
-            else:
-                logger.error(f"Single file conversion failed: HTTP {response.status_code}")
-                return False
-                
         except Exception as e:
-            logger.error(f"Single file conversion error: {e}")
+            logger.error(f"PDF/A conversion error: {e}")
             return False
+        finally:
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+    
+    def _post_multipart(self, url: str, files: List[tuple], data: Optional[Dict[str, str]] = None,
+                        **kwargs) -> requests.Response:
+        """
+        POST a multipart form to Gotenberg
+        
+        With requests-toolbelt installed the body is streamed from the open
+        file handles instead of being assembled in memory first. A streamed
+        body can't be replayed, so it is sent through the non-retrying
+        stream_session; gateway-error retries only apply without toolbelt.
+        
+        Args:
+            url: Endpoint URL
+            files: ('files', (filename, content[, content_type])) entries
+            data: Extra form fields
+            **kwargs: Passed through to session.post (timeout, stream, ...)
+        
+        Returns:
+            The response
+        """
+        try:
+            if not TOOLBELT_AVAILABLE:
+                return self.session.post(url, files=files, data=data, **kwargs)
+            
+            encoder = MultipartEncoder(fields=list((data or {}).items()) + files)
+            return self.stream_session.post(url, data=encoder, headers={'Content-Type': encoder.content_type}, **kwargs)
+        except requests.exceptions.ConnectionError:
+            # The container may have died since it was last confirmed healthy
+            self._mark_service_down()
+            raise
+    
+    def _save_response(self, response: requests.Response, output_path: str) -> int:
+        """
+        Stream a response body to disk without buffering it in memory
+        
+        Returns:
+            Number of bytes written
+        """
+        written = 0
+        with open(output_path, 'wb') as f:
+            for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+                written += len(chunk)
+        return written
     
-    def merge_pdfs(self, pdf_paths: List[str], output_path: str) -> bool:
+    def merge_pdfs(self, pdf_paths: List[Union[str, Tuple[str, bytes]]], output_path: str) -> bool:
         """
         Merge multiple PDF files into one
-        Gotenberg sorts files alphabetically by filename, so we use ordered filenames
+        Merges locally with pypdf when available, otherwise through Gotenberg
         
         Args:
-            pdf_paths: List of PDF file paths to merge (in desired order)
+            pdf_paths: PDFs to merge (in desired order), each either a file path
+                or an in-memory (filename, pdf_bytes) pair
             output_path: Output merged PDF path
         
         Returns:
             True if merge successful, False otherwise
         """
-        if not self.ensure_service_running():
-            logger.error(
-                f"Gotenberg service is not available\n"
-                f"URL: {self.base_url}\n"
-                f"Docker running: {self.check_docker_running()}\n"
-                f"Container name: {self.container_name}\n"
-                f"Try running: docker start {self.container_name}"
-            )
-            return False
-        
         if not pdf_paths:
             logger.error(
                 f"No PDFs provided for merging\n"
-                f"Output path: {output_path}\n"
-                f"Service available: {self.check_service_health()}"
+                f"Output path: {output_path}"
             )
             return False
         
+        if PYPDF_AVAILABLE:
+            if self._local_merge_pdfs(pdf_paths, output_path):
+                return True
+            logger.warning("Local pypdf merge failed, falling back to Gotenberg merge")
+        
+        return self._gotenberg_merge_pdfs(pdf_paths, output_path)
+    
+    def merge_pdfs_with_bookmarks(self, pdf_paths: List[Union[str, Tuple[str, bytes]]],
+                                  bookmark_titles: List[Optional[str]], output_path: str) -> bool:
+        """
+        Merge PDFs and add a top-level bookmark at the start of each one in a single pass
+        
+        Args:
+            pdf_paths: PDFs to merge (in desired order), each either a file path
+                or an in-memory (filename, pdf_bytes) pair
+            bookmark_titles: Bookmark title for each PDF (None for no bookmark)
+            output_path: Output merged PDF path
+        
+        Returns:
+            True if successful, False if pypdf is unavailable or the merge failed
+            (callers can fall back to merge_pdfs + add_bookmarks_to_pdf)
+        """
+        if not PYPDF_AVAILABLE:
+            return False
+        
+        return self._local_merge_pdfs(pdf_paths, output_path, bookmark_titles) > 0
+    
+    def _local_merge_pdfs(self, pdf_paths: List[Union[str, Tuple[str, bytes]]], output_path: str,
+                          outline_titles: Optional[List[Optional[str]]] = None) -> int:
+        """
+        Merge PDFs in list order with pypdf, avoiding an HTTP round-trip
+        
+        Args:
+            pdf_paths: PDFs to merge (in desired order), each either a file path
+                or an in-memory (filename, pdf_bytes) pair
+            output_path: Output merged PDF path
+            outline_titles: Optional bookmark title per PDF; when given, the
+                source PDFs' own outlines are not imported
+        
+        Returns:
+            Number of pages in the merged PDF, 0 if the merge failed
+        """
         try:
-            files = []
-            logger.info(f"PDF merge order (using alphabetical filenames for Gotenberg):")
+            writer = PdfWriter()
+            merged = 0
+            logger.info(f"PDF merge order (local pypdf merge):")
             for i, pdf_path in enumerate(pdf_paths):
-                if not os.path.exists(pdf_path):
+                if isinstance(pdf_path, tuple):
+                    filename, pdf_bytes = pdf_path
+                    source = io.BytesIO(pdf_bytes)
+                elif not os.path.exists(pdf_path):
                     logger.warning(f"PDF not found: {pdf_path}")
                     continue
+                else:
+                    filename = os.path.basename(pdf_path)
+                    source = pdf_path
                 
-                # Create ordered filename that will sort correctly alphabetically
-                # Format: 001_filename.pdf, 002_filename.pdf, etc.
-                original_filename = os.path.basename(pdf_path)
-                ordered_filename = f"{i+1:03d}_{original_filename}"
-                
-                logger.info(f"  Position {i+1}: {original_filename} -> {ordered_filename}")
-                
-                with open(pdf_path, 'rb') as f:
-                    file_content = f.read()
-                    files.append(('files', (ordered_filename, file_content, 'application/pdf')))
+                if outline_titles is None:
+                    writer.append(source)
+                else:
+                    # append() bookmarks the first page of the appended document
+                    writer.append(source, outline_item=outline_titles[i], import_outline=False)
+                merged += 1
+                logger.info(f"  Position {merged}: {filename}")
             
-            if not files:
+            if not merged:
                 logger.error("No valid PDFs to merge")
-                return False
+                return 0
             
-            logger.info(f"Merging {len(files)} PDF files...")
+            with open(output_path, 'wb') as f:
+                writer.write(f)
             
-            # Make merge request
-            response = self.session.post(
-                f'{self.base_url}/forms/pdfengines/merge',
-                files=files,
-                timeout=120  # 2 minutes timeout
-            )
+            page_count = len(writer.pages)
+            logger.info(f"Merge successful: {output_path} ({page_count} pages, {os.path.getsize(output_path):,} bytes)")
+            return page_count
             
-            if response.status_code == 200:
-                with open(output_path, 'wb') as f:
-                    f.write(response.content)
+        except Exception as e:
+            logger.error(f"Local merge error: {e}")
+            return 0
+    
+    def _gotenberg_merge_pdfs(self, pdf_paths: List[Union[str, Tuple[str, bytes]]], output_path: str) -> bool:
+        """
+        Merge PDFs through Gotenberg's merge endpoint
+        Gotenberg sorts files alphabetically by filename, so we use ordered filenames
+        
+        Args:
+            pdf_paths: PDFs to merge (in desired order), each either a file path
+                or an in-memory (filename, pdf_bytes) pair
+            output_path: Output merged PDF path
+        
+        Returns:
+            True if merge successful, False otherwise
+        """
+        if not self.ensure_service_running():
+            logger.error(
+                f"Gotenberg service is not available\n"
+                f"URL: {self.base_url}\n"
+                f"Docker running: {self.check_docker_running()}\n"
+                f"Container name: {self.container_name}\n"
+                f"Try running: docker start {self.container_name}"
+            )
+            return False
+        
+        try:
+            with ExitStack() as stack:
+                files = []
+                logger.info(f"PDF merge order (using alphabetical filenames for Gotenberg):")
+                for i, pdf_path in enumerate(pdf_paths):
+                    if isinstance(pdf_path, tuple):
+                        original_filename, pdf_bytes = pdf_path
+                        pdf_file = io.BytesIO(pdf_bytes)
+                    elif not os.path.exists(pdf_path):
+                        logger.warning(f"PDF not found: {pdf_path}")
+                        continue
+                    else:
+                        original_filename = os.path.basename(pdf_path)
+                        pdf_file = stack.enter_context(open(pdf_path, 'rb'))
+                    
+                    # Create ordered filename that will sort correctly alphabetically
+                    # Format: 001_filename.pdf, 002_filename.pdf, etc.
+                    ordered_filename = f"{i+1:03d}_{original_filename}"
+                    
+                    logger.info(f"  Position {i+1}: {original_filename} -> {ordered_filename}")
+                    
+                    files.append(('files', (ordered_filename, pdf_file, 'application/pdf')))
                 
-                file_size = len(response.content)
-                logger.info(f"Merge successful: {output_path} ({file_size:,} bytes)")
-                return True
-            else:
-                logger.error(f"Merge failed: HTTP {response.status_code}")
-                return False
+                if not files:
+                    logger.error("No valid PDFs to merge")
+                    return False
+                
+                logger.info(f"Merging {len(files)} PDF files...")
+                
+                # Make merge request
+                response = stack.enter_context(self._post_multipart(
+                    f'{self.base_url}/forms/pdfengines/merge',
+                    files,
+                    timeout=120,  # 2 minutes timeout
+                    stream=True
+                ))
+                
+                if response.status_code == 200:
+                    file_size = self._save_response(response, output_path)
+                    logger.info(f"Merge successful: {output_path} ({file_size:,} bytes)")
+                    return True
+                else:
+                    logger.error(f"Merge failed: HTTP {response.status_code}")
+                    return False
                 
         except Exception as e:
             logger.error(f"Merge error: {e}")
@@ -497,15 +992,18 @@ class GotenbergConverter:
             )
             return False
         
+        temp_path = None
         try:
             # Read the existing PDF
             with open(pdf_path, 'rb') as file:
                 reader = PdfReader(file)
-                writer = PdfWriter()
-                
-                # Copy all pages
-                for page in reader.pages:
-                    writer.add_page(page)
+                try:
+                    # Clone the whole document instead of copying page by page
+                    writer = PdfWriter(clone_from=reader)
+                except TypeError:
+                    # Older pypdf/PyPDF2 releases only offer the method form
+                    writer = PdfWriter()
+                    writer.clone_document_from_reader(reader)
                 
                 logger.info(f"Using calculated page positions for bookmarks (deterministic method)")
                 
@@ -516,42 +1014,55 @@ class GotenbergConverter:
                 # Create bookmarks using calculated page positions (deterministic)
                 logger.info(f"Creating bookmarks for {len(equipment_page_positions)} equipment groups...")
                 
+                bookmark_items = []
                 for equipment_tag in processing_order:
                     if equipment_tag in equipment_page_positions:
-                        calculated_page = equipment_page_positions[equipment_tag]
-                        
-                        # Verify page number is within PDF bounds
-                        if calculated_page < total_pages:
-                            # Display name (convert CUTSHEETS to CUT SHEETS for display)
-                            display_name = equipment_tag.replace('CUTSHEETS', 'CUT SHEETS')
-                            writer.add_outline_item(display_name, calculated_page)
-                            logger.info(f"Added bookmark: '{display_name}' at calculated page {calculated_page + 1}")
-                        else:
-                            logger.warning(f"Calculated page {calculated_page + 1} for {equipment_tag} exceeds PDF page count ({total_pages})")
+                        bookmark_items.append((equipment_page_positions[equipment_tag], equipment_tag))
                     else:
                         logger.warning(f"No calculated page position for {equipment_tag}")
                 
-                # Write the updated PDF with bookmarks
-                temp_path = pdf_path + '.tmp'
-                with open(temp_path, 'wb') as output_file:
-                    writer.write(output_file)
+                # Insert in page order so each item is appended after the previous one
+                bookmark_items.sort(key=lambda item: item[0])
                 
-                # Replace original file
-                os.replace(temp_path, pdf_path)
+                for calculated_page, equipment_tag in bookmark_items:
+                    # Verify page number is within PDF bounds
+                    if calculated_page < total_pages:
+                        # Display name (convert CUTSHEETS to CUT SHEETS for display)
+                        display_name = equipment_tag.replace('CUTSHEETS', 'CUT SHEETS')
+                        writer.add_outline_item(display_name, calculated_page)
+                        logger.info(f"Added bookmark: '{display_name}' at calculated page {calculated_page + 1}")
+                    else:
+                        logger.warning(f"Calculated page {calculated_page + 1} for {equipment_tag} exceeds PDF page count ({total_pages})")
                 
-                logger.info(f"Successfully added bookmarks to {pdf_path}")
-                return True
+                # Write the updated PDF next to the original so the replace is atomic
+                with tempfile.NamedTemporaryFile(dir=os.path.dirname(os.path.abspath(pdf_path)),
+                                                 suffix='.tmp', delete=False) as output_file:
+                    temp_path = output_file.name
+                    writer.write(output_file)
+            
+            # Replace original file
+            os.replace(temp_path, pdf_path)
+            temp_path = None
+            
+            logger.info(f"Successfully added bookmarks to {pdf_path}")
+            return True
                 
         except Exception as e:
             logger.error(f"Failed to add bookmarks: {e}")
             return False
+        finally:
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
     
-    def _count_pdf_pages(self, pdf_path: str) -> int:
+    def _count_pdf_pages(self, pdf: Union[str, bytes]) -> int:
         """
         Count pages in a PDF file
         
+        Reads /Count from the root page tree node instead of len(reader.pages),
+        which would walk and flatten the whole page tree.
+        
         Args:
-            pdf_path: Path to PDF file
+            pdf: Path to PDF file, or the PDF content as bytes
             
         Returns:
             Number of pages in the PDF
@@ -559,15 +1070,19 @@ class GotenbergConverter:
         if not PYPDF_AVAILABLE:
             logger.warning("pypdf not available, assuming 1 page")
             return 1
-            
+        
+        label = '<in-memory PDF>' if isinstance(pdf, bytes) else os.path.basename(pdf)
         try:
-            with open(pdf_path, 'rb') as file:
-                reader = PdfReader(file)
-                page_count = len(reader.pages)
-                logger.debug(f"PDF {os.path.basename(pdf_path)} has {page_count} pages")
+            with (io.BytesIO(pdf) if isinstance(pdf, bytes) else open(pdf, 'rb')) as file:
+                reader = PdfReader(file, strict=False)
+                try:
+                    page_count = int(reader.trailer['/Root']['/Pages']['/Count'])
+                except (KeyError, TypeError, ValueError):
+                    page_count = len(reader.pages)
+                logger.debug(f"PDF {label} has {page_count} pages")
                 return page_count
         except Exception as e:
-            logger.warning(f"Could not count pages in {pdf_path}: {e}")
+            logger.warning(f"Could not count pages in {label}: {e}")
             return 1  # Fallback assumption
     
     def get_service_info(self) -> Dict:
@@ -577,24 +1092,15 @@ class GotenbergConverter:
             
             return {
                 'status': 'healthy' if health_response.status_code == 200 else 'unhealthy',
-                'url': self.base_url,
-                'container_name': self.container_name,
-                'docker_available': self.check_docker_running(),
-                'quality_presets': list(self.quality_presets.keys()),
-                'title_page_generator': {
-                    'reportlab_available': self.reportlab_available,
-                    'method': 'ReportLab' if self.reportlab_available else 'HTML fallback'
-                }
+                **self._static_info,
+                'docker_available': self.check_docker_running()
             }
         except Exception as e:
             return {
                 'status': 'error',
                 'error': str(e),
                 'url': self.base_url,
-                'title_page_generator': {
-                    'reportlab_available': self.reportlab_available,
-                    'method': 'ReportLab' if self.reportlab_available else 'HTML fallback'
-                }
+                'title_page_generator': self._static_info['title_page_generator']
             }
 
 
@@ -604,7 +1110,11 @@ def test_gotenberg_converter():
     
     # Test service health
     info = converter.get_service_info()
-    print(f"Gotenberg service info: {json.dumps(info, indent=2)}")
+    if ORJSON_AVAILABLE:
+        info_json = orjson.dumps(info, option=orjson.OPT_INDENT_2).decode('utf-8')
+    else:
+        info_json = json.dumps(info, indent=2)
+    print(f"Gotenberg service info: {info_json}")
     
     if info['status'] != 'healthy':
         print("Service not healthy, attempting to start...")
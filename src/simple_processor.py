@@ -43,7 +43,9 @@ class SimpleProcessor:
     def __init__(self, progress_manager=None):
         self.config = Config()
         self.tag_extractor = SimpleTagExtractor()
-        self.gotenberg = GotenbergConverter(self.config.gotenberg_url)
+        self.gotenberg = GotenbergConverter(self.config.gotenberg_url,
+                                            max_workers=self.config.gotenberg_max_workers,
+                                            use_async=self.config.gotenberg_use_async)
         self.progress_manager = progress_manager
         self.validator = ProcessingValidator()
         
@@ -215,7 +217,7 @@ class SimpleProcessor:
         return structure_data, equipment_groups, processing_order
     
     def _convert_equipment_groups(self, equipment_groups: Dict, processing_order: List[str],
-                                 quality_mode: str, correlation_id: str) -> List[str]:
+                                 quality_mode: str, correlation_id: str, work_dir: str) -> List[str]:
         """
         Convert each equipment group to individual PDFs
         
@@ -224,6 +226,7 @@ class SimpleProcessor:
             processing_order: Order to process equipment
             quality_mode: PDF quality setting
             correlation_id: Correlation ID for tracking
+            work_dir: Directory for the intermediate group PDFs
         
         Returns:
             List of temporary PDF file paths
@@ -264,7 +267,7 @@ class SimpleProcessor:
             
             if equipment_files:
                 # Create PDF for this equipment group
-                temp_pdf = tempfile.mktemp(suffix=f'_{equipment_tag}.pdf')
+                temp_pdf = os.path.join(work_dir, f'{i:03d}_{equipment_tag}.pdf')
                 
                 result = self.gotenberg.convert_files_to_pdf(
                     file_paths=equipment_files,
@@ -320,64 +323,60 @@ class SimpleProcessor:
                            'Assembling final submittal PDF...',
                            f'Merging {len(equipment_pdfs)} equipment sections')
         
-        try:
-            # Extract PDF paths and calculate page positions
-            pdf_paths = []
-            equipment_page_positions = {}
-            current_page = 0
-            
-            for i, (pdf_path, page_count, title_page_included) in enumerate(equipment_pdfs):
-                equipment_tag = processing_order[i]
-                
-                # Each equipment group starts at current_page (title page position)
-                equipment_page_positions[equipment_tag] = current_page
-                logger.info(f"Calculated position for {equipment_tag}: page {current_page + 1}")
-                
-                pdf_paths.append(pdf_path)
-                current_page += page_count
-            
-            if len(pdf_paths) == 1:
-                # Only one PDF, just move it
-                import shutil
-                shutil.move(pdf_paths[0], output_path)
-                success = True
-            else:
-                # Merge multiple PDFs
-                success = self.gotenberg.merge_pdfs(pdf_paths, str(output_path))
-            
-            if not success or not output_path.exists():
-                raise RuntimeError(
-                    f"Failed to create final PDF at {output_path}\n"
-                    f"Merge success: {success}\n"
-                    f"File exists: {output_path.exists()}"
-                )
-            
-            # Add PDF bookmarks/outline
-            self.update_progress(correlation_id, 'assembly', 90,
-                               'Adding PDF bookmarks...',
-                               'Creating navigation outline')
-            
-            # Add bookmarks using calculated page positions (always, not dependent on structure_data)
-            bookmark_success = self.gotenberg.add_bookmarks_to_pdf(
-                str(output_path), 
-                equipment_page_positions, 
-                processing_order
+        # Extract PDF paths and calculate page positions
+        pdf_paths = []
+        equipment_page_positions = {}
+        current_page = 0
+        
+        for i, (pdf_path, page_count, title_page_included) in enumerate(equipment_pdfs):
+            equipment_tag = processing_order[i]
+            
+            # Each equipment group starts at current_page (title page position)
+            equipment_page_positions[equipment_tag] = current_page
+            logger.info(f"Calculated position for {equipment_tag}: page {current_page + 1}")
+            
+            pdf_paths.append(pdf_path)
+            current_page += page_count
+        
+        # Merge and bookmark in one pass when pypdf is available
+        bookmark_titles = [tag.replace('CUTSHEETS', 'CUT SHEETS')
+                           for tag in processing_order[:len(pdf_paths)]]
+        if self.gotenberg.merge_pdfs_with_bookmarks(pdf_paths, bookmark_titles, str(output_path)):
+            logger.info("Successfully merged PDFs with bookmarks")
+            return
+        
+        if len(pdf_paths) == 1:
+            # Only one PDF, just move it
+            import shutil
+            shutil.move(pdf_paths[0], output_path)
+            success = True
+        else:
+            # Merge multiple PDFs
+            success = self.gotenberg.merge_pdfs(pdf_paths, str(output_path))
+        
+        if not success or not output_path.exists():
+            raise RuntimeError(
+                f"Failed to create final PDF at {output_path}\n"
+                f"Merge success: {success}\n"
+                f"File exists: {output_path.exists()}"
             )
-            
-            if bookmark_success:
-                logger.info("Successfully added PDF bookmarks")
-            else:
-                logger.warning("Failed to add PDF bookmarks, but PDF generation succeeded")
-        
-        finally:
-            # Cleanup temp files
-            for pdf_path, page_count, title_page_included in equipment_pdfs:
-                try:
-                    if os.path.exists(pdf_path):
-                        os.remove(pdf_path)
-                        logger.debug(f"Cleaned up temp file: {pdf_path}")
-                except Exception as e:
-                    logger.warning(f"Failed to cleanup temp file {pdf_path}: {e}")
+        
+        # Add PDF bookmarks/outline
+        self.update_progress(correlation_id, 'assembly', 90,
+                           'Adding PDF bookmarks...',
+                           'Creating navigation outline')
+        
+        # Add bookmarks using calculated page positions (always, not dependent on structure_data)
+        bookmark_success = self.gotenberg.add_bookmarks_to_pdf(
+            str(output_path), 
+            equipment_page_positions, 
+            processing_order
+        )
+        
+        if bookmark_success:
+            logger.info("Successfully added PDF bookmarks")
+        else:
+            logger.warning("Failed to add PDF bookmarks, but PDF generation succeeded")
     
     def _finalize_processing(self, output_path: Path, output_filename: str,
                            equipment_groups: Dict, file_paths: List[str],
@@ -535,16 +534,24 @@ class SimpleProcessor:
                 file_paths, correlation_id, original_filename_map
             )
             
-            # Step 3: Convert equipment groups to PDFs
-            equipment_pdfs = self._convert_equipment_groups(
-                equipment_groups, processing_order, quality_mode, correlation_id
-            )
+            # Intermediate group PDFs live in one work directory next to the output,
+            # so the final move is a same-filesystem rename and cleanup is automatic
+            with tempfile.TemporaryDirectory(dir=output_path.parent, prefix='.dst_work_') as work_dir:
+                # Step 3: Convert equipment groups to PDFs
+                equipment_pdfs = self._convert_equipment_groups(
+                    equipment_groups, processing_order, quality_mode, correlation_id, work_dir
+                )
+                
+                # Step 4: Assemble final PDF
+                self._assemble_final_pdf(
+                    equipment_pdfs, output_path, structure_data, 
+                    processing_order, correlation_id
+                )
             
-            # Step 4: Assemble final PDF
-            self._assemble_final_pdf(
-                equipment_pdfs, output_path, structure_data, 
-                processing_order, correlation_id
-            )
+            # Optional archival pass, run once on the final submittal
+            if self.config.pdfa_format:
+                if not self.gotenberg.convert_to_pdfa(str(output_path), self.config.pdfa_format):
+                    logger.warning(f"{self.config.pdfa_format} conversion failed, keeping standard PDF output")
             
             # Step 5: Finalize and return results
             return self._finalize_processing(
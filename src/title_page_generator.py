@@ -4,9 +4,10 @@ Title page generator for DST Submittals using ReportLab
 Creates professional title pages with perfect vertical centering
 """
 
+import io
 import os
 import tempfile
-from typing import Optional
+from typing import BinaryIO, Optional, Union
 
 try:
     from reportlab.lib.pagesizes import letter
@@ -26,6 +27,18 @@ except ImportError:
 
 logger = get_logger('title_page_generator')
 
+# Helvetica-Bold advance widths (1/1000 em) for characters common in equipment tags,
+# used to center the plain fallback title page
+_HELVETICA_BOLD_WIDTHS = {
+    ' ': 278, ',': 278, '.': 278, '/': 278, '-': 333, '(': 333, ')': 333, '&': 722,
+    **dict.fromkeys('0123456789', 556),
+    'A': 722, 'B': 722, 'C': 722, 'D': 722, 'E': 667, 'F': 611, 'G': 778, 'H': 722,
+    'I': 278, 'J': 556, 'K': 722, 'L': 611, 'M': 833, 'N': 722, 'O': 778, 'P': 667,
+    'Q': 778, 'R': 722, 'S': 667, 'T': 611, 'U': 722, 'V': 667, 'W': 944, 'X': 667,
+    'Y': 667, 'Z': 611
+}
+_DEFAULT_GLYPH_WIDTH = 611
+
 
 class TitlePageGenerator:
     """
@@ -92,33 +105,7 @@ class TitlePageGenerator:
             if output_path is None:
                 output_path = tempfile.mktemp(suffix=f'_title_{equipment_tag.replace("-", "_").replace(",", "_")}.pdf')
             
-            # Transform equipment tag for display (same logic as HTML version)
-            display_tag = equipment_tag.replace('CUTSHEETS', 'CUT SHEETS')
-            
-            # Create document with letter size (8.5" x 11")
-            doc = SimpleDocTemplate(
-                output_path,
-                pagesize=letter,
-                rightMargin=72,  # 1 inch margins
-                leftMargin=72,
-                topMargin=72,
-                bottomMargin=72
-            )
-            
-            story = []
-            
-            # Add vertical spacing to center the text vertically
-            # 3.5 inches from top on 11" page = perfectly centered
-            story.append(Spacer(1, 3.5*inch))
-            
-            # Add the main title
-            story.append(Paragraph(display_tag, self.title_style))
-            
-            # Add some space after title
-            story.append(Spacer(1, 1*inch))
-            
-            # Build the PDF
-            doc.build(story)
+            display_tag = self._build_title_page(equipment_tag, output_path)
             
             logger.info(f"Created ReportLab title page: {os.path.basename(output_path)} for tag '{display_tag}'")
             return output_path
@@ -128,6 +115,62 @@ class TitlePageGenerator:
             logger.error(error_msg)
             raise RuntimeError(error_msg) from e
     
+    def create_title_page_bytes(self, equipment_tag: str) -> bytes:
+        """
+        Create a title page PDF in memory for the given equipment tag
+        
+        Args:
+            equipment_tag: Equipment identifier (e.g., "BCU-1,2", "CUTSHEETS")
+        
+        Returns:
+            PDF content as bytes
+        
+        Raises:
+            RuntimeError: If PDF creation fails
+        """
+        try:
+            buffer = io.BytesIO()
+            display_tag = self._build_title_page(equipment_tag, buffer)
+            logger.info(f"Created ReportLab title page in memory for tag '{display_tag}'")
+            return buffer.getvalue()
+            
+        except Exception as e:
+            error_msg = f"Failed to create title page PDF for {equipment_tag}: {e}"
+            logger.error(error_msg)
+            raise RuntimeError(error_msg) from e
+    
+    def _build_title_page(self, equipment_tag: str, target: Union[str, BinaryIO]) -> str:
+        """Render the title page to a path or binary file object, returning the display tag"""
+        # Transform equipment tag for display (same logic as HTML version)
+        display_tag = equipment_tag.replace('CUTSHEETS', 'CUT SHEETS')
+        
+        # Create document with letter size (8.5" x 11")
+        doc = SimpleDocTemplate(
+            target,
+            pagesize=letter,
+            rightMargin=72,  # 1 inch margins
+            leftMargin=72,
+            topMargin=72,
+            bottomMargin=72
+        )
+        
+        story = []
+        
+        # Add vertical spacing to center the text vertically
+        # 3.5 inches from top on 11" page = perfectly centered
+        story.append(Spacer(1, 3.5*inch))
+        
+        # Add the main title
+        story.append(Paragraph(display_tag, self.title_style))
+        
+        # Add some space after title
+        story.append(Spacer(1, 1*inch))
+        
+        # Build the PDF
+        doc.build(story)
+        
+        return display_tag
+    
     def create_title_page_for_tag(self, equipment_tag: str) -> str:
         """
         Convenience method to create a title page with automatic file naming
@@ -160,6 +203,56 @@ class TitlePageGenerator:
         }
 
 
+def create_plain_title_page_bytes(equipment_tag: str) -> bytes:
+    """
+    Build a one-page title PDF without ReportLab
+    
+    Writes the PDF objects directly, using the standard Helvetica-Bold font
+    (no embedding), so it works with no optional dependencies installed.
+    The title is centered on a letter-size page and shrunk to fit if long.
+    
+    Args:
+        equipment_tag: Equipment identifier (e.g., "BCU-1,2", "CUTSHEETS")
+    
+    Returns:
+        PDF content as bytes
+    """
+    display_tag = equipment_tag.replace('CUTSHEETS', 'CUT SHEETS')
+    page_width, page_height = 612, 792  # Letter size in points
+    
+    text_units = sum(_HELVETICA_BOLD_WIDTHS.get(ch, _DEFAULT_GLYPH_WIDTH) for ch in display_tag) or 1
+    font_size = min(48, (page_width - 144) * 1000 / text_units)  # Fit within 1 inch margins
+    x = (page_width - text_units * font_size / 1000) / 2
+    y = (page_height - font_size * 0.7) / 2  # Cap height is roughly 0.7 em
+    
+    text = display_tag.encode('latin-1', 'replace')
+    text = text.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)')
+    content = b'BT /F1 %.2f Tf %.2f %.2f Td (%s) Tj ET' % (font_size, x, y, text)
+    
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+        b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] '
+        b'/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>' % (page_width, page_height),
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>',
+        b'<< /Length %d >>\nstream\n%s\nendstream' % (len(content), content),
+    ]
+    
+    pdf = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += b'%d 0 obj\n%s\nendobj\n' % (number, body)
+    
+    xref_offset = len(pdf)
+    pdf += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    for offset in offsets:
+        pdf += b'%010d 00000 n \n' % offset
+    pdf += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref_offset)
+    
+    return bytes(pdf)
+
+
 def test_title_page_generator():
     """Test the title page generator"""
     if not REPORTLAB_AVAILABLE: